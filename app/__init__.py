@@ -6,11 +6,6 @@ from pathlib import Path
 
 from app.utils import temp_file_path
 
-try:
-    from flask import Flask, Response, jsonify, request
-except ImportError:
-    Flask = None  # Fallback if flask not installed
-
 from app.config import CalendarConfig
 from app.exceptions import (
     CalendarError,
@@ -57,8 +52,11 @@ def setup_writer(format: str = "ics"):
 
 def create_app():
     """Create and configure Flask application."""
-    if Flask is None:
-        raise ImportError("Flask is required for create_app()")
+    # Flask is only needed by the web app; keep it off the CLI's import path
+    try:
+        from flask import Flask, Response, jsonify, request
+    except ImportError as e:
+        raise ImportError("Flask is required for create_app()") from e
 
     app = Flask(__name__)
 
@@ -47,9 +47,10 @@ class IngestionService:
             IngestionError: On file reading errors
             InvalidYearError: On year validation errors
         """
-        input_path = Path(path).expanduser().resolve()
+        input_path = Path(path).expanduser()
         if not input_path.exists():
             raise FileNotFoundError(f"Input file not found: {path}")
+        input_path = input_path.resolve()
 
         # Get appropriate reader
         reader = self.registry.get_reader(input_path)
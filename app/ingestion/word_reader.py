@@ -8,9 +8,7 @@ import subprocess
 import tempfile
 from datetime import date, datetime
 from pathlib import Path
-from typing import List
-
-from docx import Document
+from typing import TYPE_CHECKING, List
 
 from app.exceptions import IngestionError, InvalidYearError
 from app.ingestion.summary import build_ingestion_summary
@@ -18,6 +16,9 @@ from app.models.event import Event
 from app.models.ingestion import IngestionResult, RawIngestion
 from app.models.template import CalendarTemplate, EventTypeConfig
 
+if TYPE_CHECKING:
+    from docx.document import Document
+
 logger = logging.getLogger(__name__)
 
 
@@ -143,7 +144,7 @@ def extract_year_from_header(header: str) -> int | None:
         return None
 
 
-def extract_revised_date(doc: Document) -> date | None:
+def extract_revised_date(doc: "Document") -> date | None:
     """Extract revised date from document header.
 
     Looks for pattern like "Revised December 16, 2025" in headers or paragraphs.
@@ -481,6 +482,9 @@ class WordReader:
             logger.info(f"Using template: {template.name} (version {template.version})")
         else:
             logger.info("No template provided")
+        # python-docx is slow to import; load it only when a document is read
+        from docx import Document
+
         doc = Document(str(docx_path))
         events = []
 
@@ -1,6 +1,6 @@
 """Pydantic models for calendar sync."""
 
-from app.models.calendar import Calendar
+from app.models.calendar import Calendar, CalendarSummary
 from app.models.event import Event
 from app.models.ingestion import RawIngestion
 from app.models.settings import CalendarSettings
@@ -8,6 +8,7 @@ from app.models.settings import CalendarSettings
 __all__ = [
     "Event",
     "Calendar",
+    "CalendarSummary",
     "CalendarSettings",
     "RawIngestion",
 ]
@@ -38,12 +38,42 @@ class Calendar(BaseModel):
             time: lambda v: v.strftime("%H%M"),
         }
 
+    def date_range(self) -> tuple[date, date] | None:
+        """Get the earliest and latest event dates in a single pass.
+
+        Events are not kept in date order, so every event is visited.
+
+        Returns:
+            Tuple of (min_date, max_date), or None if there are no events
+        """
+        if not self.events:
+            return None
+        min_date = max_date = self.events[0].date
+        for event in self.events:
+            event_date = event.date
+            if event_date < min_date:
+                min_date = event_date
+            elif event_date > max_date:
+                max_date = event_date
+        return min_date, max_date
+
     def save(self, path: Path) -> None:
         """Save to native JSON format (canonical storage).
 
+        See to_json() for the serialized layout.
+        """
+        path.write_text(self.to_json())
+
+    def to_json(self) -> str:
+        """Serialize to native JSON format (canonical storage).
+
         Uses compact serialization:
         - Excludes None values
         - Excludes computed fields (is_all_day, is_overnight)
+
+        Also stores the event date range (min_date, max_date) alongside the
+        metadata, so it can be read without walking the events. These keys
+        are derived on every save and ignored when loading.
         """
 
         def json_encoder(obj):
@@ -61,7 +91,10 @@ class Calendar(BaseModel):
             exclude_none=True,
             exclude={"events": {"__all__": {"is_all_day", "is_overnight"}}},
         )
-        path.write_text(json.dumps(data, indent=2, default=json_encoder))
+        event_dates = self.date_range()
+        if event_dates:
+            data["min_date"], data["max_date"] = event_dates
+        return json.dumps(data, indent=2, default=json_encoder)
 
     @classmethod
     def load(cls, path: Path) -> "Calendar":
@@ -71,26 +104,75 @@ class Calendar(BaseModel):
         Legacy format: {calendar: {events, ...}, metadata: {...}}
         New format: {events, name, created, ...}
         """
-        data = json.loads(path.read_text())
-
-        # Check if this is the legacy nested format
-        if "calendar" in data and "metadata" in data:
-            # Legacy format - flatten it
-            calendar_data = data["calendar"]
-            metadata = data["metadata"]
-
-            flat_data = {
-                "events": calendar_data.get("events", []),
-                "name": metadata.get("name"),
-                "created": metadata.get("created"),
-                "last_updated": metadata.get("last_updated"),
-                "source": metadata.get("source"),
-                "source_revised_at": metadata.get("source_revised_at"),
-                "composed_from": metadata.get("composed_from"),
-                "template_name": metadata.get("template_name"),
-                "template_version": metadata.get("template_version"),
-            }
-            return cls.model_validate(flat_data)
-
-        # New flat format
+        return cls.model_validate(_read_calendar_json(path))
+
+
+class CalendarSummary(BaseModel):
+    """Calendar metadata with event statistics, loaded without the events.
+
+    Reading a summary skips validating every event into an Event model,
+    which dominates the cost of loading large calendars.
+    """
+
+    name: str
+    created: datetime
+    last_updated: datetime
+    source: str | None = None
+    source_revised_at: date | None = None
+    composed_from: list[str] | None = None
+    template_name: str | None = None
+    template_version: str | None = None
+
+    # Event statistics
+    event_count: int = 0
+    min_date: date | None = None
+    max_date: date | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> "CalendarSummary":
+        """Load a summary from native JSON format (flat or legacy nested).
+
+        Uses the date range stored by Calendar.save, falling back to
+        scanning the raw event dates for files saved before it was stored.
+        """
+        data = _read_calendar_json(path)
+        events = data.pop("events", None) or []
+        data["event_count"] = len(events)
+        if events and "min_date" not in data:
+            # ISO dates order correctly as strings, so no parsing is needed
+            event_dates = [event["date"] for event in events]
+            data["min_date"] = min(event_dates)
+            data["max_date"] = max(event_dates)
         return cls.model_validate(data)
+
+    def date_range(self) -> tuple[date, date] | None:
+        """Get the earliest and latest event dates, or None if there are no events."""
+        if self.min_date is None or self.max_date is None:
+            return None
+        return self.min_date, self.max_date
+
+
+def _read_calendar_json(path: Path) -> dict:
+    """Read calendar JSON, flattening the legacy nested format."""
+    data = json.loads(path.read_text())
+
+    # Check if this is the legacy nested format
+    if "calendar" in data and "metadata" in data:
+        # Legacy format - flatten it
+        calendar_data = data["calendar"]
+        metadata = data["metadata"]
+
+        return {
+            "events": calendar_data.get("events", []),
+            "name": metadata.get("name"),
+            "created": metadata.get("created"),
+            "last_updated": metadata.get("last_updated"),
+            "source": metadata.get("source"),
+            "source_revised_at": metadata.get("source_revised_at"),
+            "composed_from": metadata.get("composed_from"),
+            "template_name": metadata.get("template_name"),
+            "template_version": metadata.get("template_version"),
+        }
+
+    # New flat format
+    return data
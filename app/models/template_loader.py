@@ -8,8 +8,19 @@ from app.models.template import CalendarTemplate
 
 logger = logging.getLogger(__name__)
 
-# Cache for loaded templates
-_template_cache: dict[str, CalendarTemplate] = {}
+# Cache for loaded templates: each entry holds the template and the
+# (path, mtime) of every file it was built from (itself and its ancestors)
+_template_cache: dict[
+    str, tuple[CalendarTemplate, tuple[tuple[Path, int], ...]]
+] = {}
+
+
+def _is_fresh(sources: tuple[tuple[Path, int], ...]) -> bool:
+    """Check that none of a cached template's source files changed on disk."""
+    try:
+        return all(path.stat().st_mtime_ns == mtime for path, mtime in sources)
+    except FileNotFoundError:
+        return False
 
 
 def _merge_template_data(base_data: dict, extending_data: dict) -> dict:
@@ -84,6 +95,9 @@ def load_template(template_name: str, template_dir: Path) -> CalendarTemplate:
     Load a template from disk, using cache if available.
     Handles template extensions by loading base templates and merging.
 
+    Cached templates are reused until the template file, or any template it
+    extends, is modified on disk.
+
     Args:
         template_name: Name of template (without .json extension)
         template_dir: Directory containing template files
@@ -97,13 +111,16 @@ def load_template(template_name: str, template_dir: Path) -> CalendarTemplate:
     """
     # Check cache first
     cache_key = f"{template_dir}/{template_name}"
-    if cache_key in _template_cache:
-        return _template_cache[cache_key]
+    cached = _template_cache.get(cache_key)
+    if cached is not None and _is_fresh(cached[1]):
+        return cached[0]
 
     # Load from file
     template_path = template_dir / f"{template_name}.json"
-    if not template_path.exists():
-        raise FileNotFoundError(f"Template not found: {template_path}")
+    try:
+        sources = ((template_path, template_path.stat().st_mtime_ns),)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {template_path}") from None
 
     try:
         with open(template_path, "r") as f:
@@ -114,6 +131,7 @@ def load_template(template_name: str, template_dir: Path) -> CalendarTemplate:
         if extends_name:
             # Load base template first (recursive, may also extend)
             base_template = load_template(extends_name, template_dir)
+            sources += _template_cache[f"{template_dir}/{extends_name}"][1]
             # Merge extending template data over base template data
             # Use by_alias=True to get JSON-compatible format (with aliases like 'as' instead of 'as_')
             # Then serialize to JSON and parse back to ensure all nested models use aliases
@@ -126,7 +144,7 @@ def load_template(template_name: str, template_dir: Path) -> CalendarTemplate:
         else:
             template = CalendarTemplate(**data)
 
-        _template_cache[cache_key] = template
+        _template_cache[cache_key] = (template, sources)
         logger.info(f"Loaded template: {template_name} from {template_path}")
         return template
     except json.JSONDecodeError as e:
@@ -98,6 +98,7 @@ class CalendarManager:
         raw: RawIngestion,
         strategy: MergeStrategy,
         template: CalendarTemplate | None = None,
+        existing: Calendar | None = None,
     ) -> ProcessingResult:
         """Update an existing calendar using a merge strategy.
 
@@ -106,6 +107,8 @@ class CalendarManager:
             raw: Raw ingestion data (events + revised_at)
             strategy: Merge strategy to use
             template: Optional template configuration
+            existing: The calendar as already loaded by the caller; loaded
+                from the repository if not given
 
         Returns:
             ProcessingResult with the updated calendar
@@ -113,8 +116,9 @@ class CalendarManager:
         Raises:
             CalendarNotFoundError: If calendar doesn't exist
         """
-        # Load existing calendar
-        existing = self.repository.load_calendar(calendar_name)
+        # Load existing calendar unless the caller already has it
+        if existing is None:
+            existing = self.repository.load_calendar(calendar_name)
         if existing is None:
             raise CalendarNotFoundError(f"Calendar '{calendar_name}' not found")
 
@@ -156,6 +160,7 @@ class CalendarManager:
         template: CalendarTemplate | None = None,
         strategy: MergeStrategy | None = None,
         year: int | None = None,
+        existing: Calendar | None = None,
     ) -> ProcessingResult:
         """Create new calendar or update existing one.
 
@@ -168,6 +173,8 @@ class CalendarManager:
             template: Optional template configuration
             strategy: Merge strategy (auto-determined if None)
             year: Year for ReplaceByYear (used if strategy not specified)
+            existing: Existing calendar already loaded by the caller, passed
+                on to update_calendar() so it isn't read again
 
         Returns:
             ProcessingResult with processed calendar, summary, and year
@@ -185,7 +192,9 @@ class CalendarManager:
             effective_year = self._determine_year(raw.events, year)
             strategy = ReplaceByYear(effective_year)
 
-        return self.update_calendar(calendar_name, raw, strategy, template)
+        return self.update_calendar(
+            calendar_name, raw, strategy, template, existing=existing
+        )
 
     def _determine_year(self, events: list[Event], year: int | None) -> int:
         """Determine the year to use for ReplaceByYear strategy.
@@ -124,9 +124,14 @@ def _merge_by_uid(
       - If uid is not in new events, keep existing
     - All new events are added (replacing any existing with same uid)
     """
-    # Build uid -> event map from new events
-    new_by_uid = {e.uid: e for e in new if e.uid}
-    new_without_uid = [e for e in new if not e.uid]
+    # Split new events into a uid -> event map and uid-less events in one pass
+    new_by_uid: dict[str, Event] = {}
+    new_without_uid: list[Event] = []
+    for e in new:
+        if e.uid:
+            new_by_uid[e.uid] = e
+        else:
+            new_without_uid.append(e)
     
     result = []
     
@@ -1,13 +1,14 @@
 """Calendar repository for managing named calendars."""
 
+import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 from app.exceptions import CalendarNotFoundError
 from app.ingestion.base import ReaderRegistry
-from app.models.calendar import Calendar
+from app.models.calendar import Calendar, CalendarSummary
 from app.models.settings import CalendarSettings
 from app.output.ics_writer import ICSWriter
 from app.storage.calendar_paths import CalendarPaths
@@ -79,15 +80,23 @@ class CalendarRepository:
         The format parameter is kept for backwards compatibility but ignored.
         Calendars are always loaded from the canonical JSON format.
         """
-        paths = self.paths(name)
-        if not paths.directory.exists():
+        # Open canonical JSON directly; a missing file or directory means no data
+        try:
+            return Calendar.load(self.paths(name).data)
+        except FileNotFoundError:
             return None
 
-        # Try loading from canonical JSON
-        if paths.data.exists():
-            return Calendar.load(paths.data)
+    def load_calendar_summary(self, name: str) -> CalendarSummary | None:
+        """
+        Load calendar metadata and event statistics without the events.
 
-        return None
+        Returns:
+            CalendarSummary or None if the calendar has no data
+        """
+        try:
+            return CalendarSummary.load(self.paths(name).data)
+        except FileNotFoundError:
+            return None
 
     def load_calendar_by_commit(
         self, name: str, commit: str, format: str = "ics"
@@ -112,7 +121,8 @@ class CalendarRepository:
         # Parse the content - Calendar.load handles both old and new formats
         import json
 
-        data = json.loads(content.decode("utf-8"))
+        # json.loads reads UTF-8 bytes directly; no intermediate str copy
+        data = json.loads(content)
 
         # Check if this is the legacy nested format
         if "calendar" in data and "metadata" in data:
@@ -186,21 +196,45 @@ class CalendarRepository:
         Returns:
             Path to canonical JSON file
         """
-        paths = self.paths(calendar.name)
-        paths.directory.mkdir(parents=True, exist_ok=True)
+        return self.write_json(calendar.name, self.serialize_json(calendar))
 
-        # Update timestamp
+    def serialize_json(self, calendar: Calendar) -> str:
+        """
+        Stamp a calendar's last_updated time and serialize it to canonical JSON.
+
+        Together with write_json() this splits save_json() in two, so the
+        serialization can be prepared before it is known the file will be written.
+
+        Args:
+            calendar: Calendar to serialize
+
+        Returns:
+            Canonical JSON content
+        """
         calendar.last_updated = datetime.now()
+        return calendar.to_json()
 
-        # Save to canonical JSON format
-        calendar.save(paths.data)
+    def write_json(self, name: str, content: str) -> Path:
+        """
+        Write serialized canonical JSON for a calendar.
+
+        Args:
+            name: Calendar name
+            content: Canonical JSON content from serialize_json()
 
+        Returns:
+            Path to canonical JSON file
+        """
+        paths = self.paths(name)
+        paths.directory.mkdir(parents=True, exist_ok=True)
+        paths.data.write_text(content)
         return paths.data
 
     def export_ics(
         self,
         name: str,
         template: "CalendarTemplate | None" = None,
+        calendar: Calendar | None = None,
     ) -> Path:
         """
         Export calendar to ICS format with template resolution.
@@ -211,6 +245,8 @@ class CalendarRepository:
         Args:
             name: Calendar name
             template: Optional template for resolving location_id references
+            calendar: Already-loaded calendar to export, to avoid reading
+                data.json again (loaded from disk if not provided)
 
         Returns:
             Path to ICS export file
@@ -219,7 +255,8 @@ class CalendarRepository:
             CalendarNotFoundError: If calendar not found
             ExportError: If location_id references cannot be resolved
         """
-        calendar = self.load_calendar(name)
+        if calendar is None:
+            calendar = self.load_calendar(name)
         if calendar is None:
             raise CalendarNotFoundError(f"Calendar '{name}' not found")
 
@@ -332,6 +369,30 @@ class CalendarRepository:
         """Check if a calendar exists (has config.json)."""
         return self.paths(name).exists
 
+    def iter_calendars(self) -> Iterator[str]:
+        """
+        Yield calendar names as the calendar directory is scanned.
+
+        A calendar is defined by having a config.json file in its directory.
+        Unlike list_calendars, names are yielded in directory order (unsorted)
+        and calendars only present in git history are not included.
+
+        Yields:
+            Calendar names
+        """
+        try:
+            entries = os.scandir(self.calendar_dir)
+        except FileNotFoundError:
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                # Only include if config.json exists
+                if self.paths(entry.name).exists:
+                    yield entry.name
+
     def list_calendars(self, include_deleted: bool = False) -> list[str]:
         """
         List all available calendar names.
@@ -345,15 +406,8 @@ class CalendarRepository:
         Returns:
             List of calendar names
         """
-        calendars = set()
-
         # Get calendars from filesystem (directories with config.json)
-        if self.calendar_dir.exists():
-            for d in self.calendar_dir.iterdir():
-                if d.is_dir() and not d.name.startswith("."):
-                    # Only include if config.json exists
-                    if self.paths(d.name).exists:
-                        calendars.add(d.name)
+        calendars = set(self.iter_calendars())
 
         # If including deleted, check git history for calendar files
         if include_deleted:
@@ -393,19 +447,43 @@ class CalendarRepository:
         return sorted(calendars)
 
     def list_calendar_versions(
-        self, name: str, format: str = "ics"
+        self, name: str, format: str = "ics", max_count: int | None = None
     ) -> list[tuple[str, datetime, str]]:
         """
-        List all versions from git log.
+        List versions from git log, most recent first.
 
         Works even if the file doesn't exist in the working directory (checks git history).
         The format parameter is kept for backwards compatibility.
 
+        Args:
+            name: Calendar name
+            format: Ignored (kept for backwards compatibility)
+            max_count: Only list this many of the most recent versions
+                (None for the full history)
+
         Returns:
             List of (commit_hash, commit_date, commit_message) tuples
         """
         paths = self.paths(name)
-        return self.git_service.get_file_versions(paths.data)
+        return self.git_service.get_file_versions(paths.data, max_count=max_count)
+
+    def count_calendar_versions(self, name: str) -> int:
+        """Count versions in git history without listing them."""
+        return self.git_service.count_file_versions(self.paths(name).data)
+
+    def get_latest_calendar_version(
+        self, name: str
+    ) -> tuple[str, datetime, str] | None:
+        """
+        Get the most recent version from git log.
+
+        Returns:
+            (commit_hash, commit_date, commit_message) tuple, or None if untracked
+        """
+        versions = self.git_service.get_file_versions(
+            self.paths(name).data, max_count=1
+        )
+        return versions[0] if versions else None
 
     def delete_calendar(self, name: str) -> None:
         """Delete calendar directory and all contents."""
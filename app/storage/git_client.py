@@ -40,13 +40,16 @@ class GitClient(Protocol):
         """
         ...
 
-    def run_command_binary(self, cmd: List[str], cwd: Path) -> BinaryCommandResult:
+    def run_command_binary(
+        self, cmd: List[str], cwd: Path, input: bytes | None = None
+    ) -> BinaryCommandResult:
         """
         Execute a git command returning binary stdout.
 
         Args:
             cmd: Git command as list of strings
             cwd: Working directory for command execution
+            input: Optional bytes to feed to the command's stdin
 
         Returns:
             BinaryCommandResult with returncode, binary stdout, and stderr
@@ -89,7 +92,9 @@ class SubprocessGitClient:
                 stderr=str(e),
             )
 
-    def run_command_binary(self, cmd: List[str], cwd: Path) -> BinaryCommandResult:
+    def run_command_binary(
+        self, cmd: List[str], cwd: Path, input: bytes | None = None
+    ) -> BinaryCommandResult:
         """
         Execute a git command returning binary stdout.
 
@@ -98,6 +103,7 @@ class SubprocessGitClient:
         Args:
             cmd: Git command as list of strings
             cwd: Working directory for command execution
+            input: Optional bytes to feed to the command's stdin
 
         Returns:
             BinaryCommandResult with returncode, binary stdout, and stderr
@@ -106,6 +112,7 @@ class SubprocessGitClient:
             result = subprocess.run(
                 cmd,
                 cwd=cwd,
+                input=input,
                 capture_output=True,
                 check=False,
             )
@@ -1,7 +1,9 @@
 """Unified git service for calendar operations."""
 
+import hashlib
 import logging
 import sys
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -11,6 +13,22 @@ from app.storage.git_client import GitClient, SubprocessGitClient
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class FileHistorySummary:
+    """Git history summary for a single file."""
+
+    commit_count: int
+    latest: tuple[str, datetime, str] | None  # (commit_hash, commit_date, commit_message)
+    remote_url: str | None
+
+
+def _git_blob_id(content: bytes, algorithm: str = "sha1") -> str:
+    """Compute the id git assigns to a blob with this content."""
+    digest = hashlib.new(algorithm, b"blob %d\0" % len(content))
+    digest.update(content)
+    return digest.hexdigest()
+
+
 class GitService:
     """Unified service for git operations (versioning and publishing)."""
 
@@ -99,12 +117,16 @@ class GitService:
 
     # Version operations (from GitVersionService)
 
-    def get_file_versions(self, file_path: Path) -> list[tuple[str, datetime, str]]:
+    def get_file_versions(
+        self, file_path: Path, max_count: int | None = None
+    ) -> list[tuple[str, datetime, str]]:
         """
         Get git log for a specific file.
 
         Args:
             file_path: Path to file (relative to repo root or absolute)
+            max_count: Only return this many of the most recent versions
+                (None for the full history)
 
         Returns:
             List of (commit_hash, commit_date, commit_message) tuples
@@ -112,10 +134,19 @@ class GitService:
         if not self._is_git_repo():
             return []
 
+        return self._log_file_versions(file_path, max_count)
+
+    def _log_file_versions(
+        self, file_path: Path, max_count: int | None = None
+    ) -> list[tuple[str, datetime, str]]:
+        """Run git log for a file, assuming repo_root is a git repository."""
         rel_path = self._get_relative_path(file_path)
 
+        cmd = ["git", "log", "--format=%H|%ai|%s"]
+        if max_count is not None:
+            cmd.append(f"--max-count={max_count}")
         result = self.git_client.run_command(
-            ["git", "log", "--format=%H|%ai|%s", "--", str(rel_path)],
+            cmd + ["--", str(rel_path)],
             self.repo_root,
         )
 
@@ -147,6 +178,86 @@ class GitService:
 
         return versions
 
+    def count_file_versions(self, file_path: Path) -> int:
+        """
+        Count the commits that modified a file, without listing them.
+
+        Args:
+            file_path: Path to file (relative to repo root or absolute)
+
+        Returns:
+            Number of commits touching the file (0 if not in git)
+        """
+        if not self._is_git_repo():
+            return 0
+
+        return self._count_file_versions(file_path)
+
+    def _count_file_versions(self, file_path: Path) -> int:
+        """Run git rev-list --count for a file, assuming repo_root is a git repository."""
+        rel_path = self._get_relative_path(file_path)
+
+        result = self.git_client.run_command(
+            ["git", "rev-list", "--count", "HEAD", "--", str(rel_path)],
+            self.repo_root,
+        )
+
+        # Fails on a repository without commits (no HEAD yet)
+        if result.returncode != 0:
+            return 0
+
+        return int(result.stdout.strip() or 0)
+
+    def get_file_history_summary(self, file_path: Path) -> FileHistorySummary:
+        """
+        Get a file's commit count, latest version and the remote URL together.
+
+        Checks for a git repository once for all three lookups, instead of
+        once per lookup as the individual public methods do.
+
+        Args:
+            file_path: Path to file (relative to repo root or absolute)
+
+        Returns:
+            FileHistorySummary (empty if not in a git repository)
+        """
+        if not self._is_git_repo():
+            return FileHistorySummary(commit_count=0, latest=None, remote_url=None)
+
+        commit_count = self._count_file_versions(file_path)
+        latest = None
+        if commit_count:
+            versions = self._log_file_versions(file_path, max_count=1)
+            latest = versions[0] if versions else None
+
+        return FileHistorySummary(
+            commit_count=commit_count,
+            latest=latest,
+            remote_url=self._get_remote_url(),
+        )
+
+    def get_commit_date(self, commit: str) -> datetime | None:
+        """
+        Get the author date of a single commit.
+
+        Args:
+            commit: Commit hash or reference
+
+        Returns:
+            Commit date, or None if the commit can't be found
+        """
+        result = self.git_client.run_command(
+            ["git", "show", "-s", "--format=%ai", commit], self.repo_root
+        )
+
+        if result.returncode != 0:
+            return None
+
+        try:
+            return datetime.strptime(result.stdout.strip(), "%Y-%m-%d %H:%M:%S %z")
+        except ValueError:
+            return None
+
     def get_file_at_commit(self, file_path: Path, commit: str) -> bytes | None:
         """
         Get file content at specific commit without checking out.
@@ -174,6 +285,99 @@ class GitService:
 
         return result.stdout
 
+    def get_files_at_commits(
+        self, file_path: Path, commits: list[str]
+    ) -> dict[str, tuple[str, bytes]]:
+        """
+        Get file content at several commits with a single git process.
+
+        Requests are piped to 'git cat-file --batch', which streams back every
+        blob, instead of running 'git show' once per commit.
+
+        Args:
+            file_path: Path to file (relative to repo root or absolute)
+            commits: Git commit hashes or tags
+
+        Returns:
+            Mapping of commit to (blob id, file content as bytes). The blob id
+            identifies the content, so callers can tell repeated content
+            apart without comparing it. Commits where the file does not
+            exist are omitted.
+        """
+        if not commits or not self._is_git_repo():
+            return {}
+
+        rel_path = self._get_relative_path(file_path).as_posix()
+        requests = "".join(f"{commit}:{rel_path}\n" for commit in commits)
+
+        result = self.git_client.run_command_binary(
+            ["git", "cat-file", "--batch"], self.repo_root, input=requests.encode()
+        )
+        if result.returncode != 0:
+            logger.warning(f"Git cat-file failed: {result.stderr}")
+            return {}
+
+        # Each response is "<sha> <type> <size>\n<content>\n", or a single
+        # "<object> missing" line when the path doesn't exist at that commit
+        output = result.stdout
+        contents: dict[str, tuple[str, bytes]] = {}
+        pos = 0
+        for commit in commits:
+            eol = output.find(b"\n", pos)
+            if eol == -1:
+                break
+            header = output[pos:eol]
+            pos = eol + 1
+            if header.endswith((b" missing", b" ambiguous")):
+                continue
+            object_id, object_type, size = header.split(b" ")
+            end = pos + int(size)
+            if object_type == b"blob":
+                contents[commit] = (object_id.decode(), output[pos:end])
+            pos = end + 1
+
+        return contents
+
+    def get_blob_ids_at_commits(
+        self, file_path: Path, commits: list[str]
+    ) -> dict[str, str]:
+        """
+        Get the git blob id of a file at several commits without reading content.
+
+        Uses a single 'git cat-file --batch-check' process, which reports only
+        object ids, types and sizes.
+
+        Args:
+            file_path: Path to file (relative to repo root or absolute)
+            commits: Git commit hashes or tags
+
+        Returns:
+            Mapping of commit to blob id (hex). Commits where the file does not
+            exist are omitted.
+        """
+        if not commits or not self._is_git_repo():
+            return {}
+
+        rel_path = self._get_relative_path(file_path).as_posix()
+        requests = "".join(f"{commit}:{rel_path}\n" for commit in commits)
+
+        result = self.git_client.run_command_binary(
+            ["git", "cat-file", "--batch-check"],
+            self.repo_root,
+            input=requests.encode(),
+        )
+        if result.returncode != 0:
+            logger.warning(f"Git cat-file failed: {result.stderr}")
+            return {}
+
+        # One "<sha> <type> <size>" or "<object> missing" line per request
+        blob_ids: dict[str, str] = {}
+        for commit, line in zip(commits, result.stdout.decode().splitlines()):
+            parts = line.split(" ")
+            if len(parts) == 3 and parts[1] == "blob":
+                blob_ids[commit] = parts[0]
+        return blob_ids
+
     def restore_file_version(self, file_path: Path, commit: str) -> bool:
         """
         Checkout specific version of file from git.
@@ -249,6 +453,38 @@ class GitService:
         # Exit code 0 means file matches HEAD
         return result.returncode == 0
 
+    def file_unchanged_between(
+        self, file_path: Path, commit1: str | None, commit2: str | None
+    ) -> bool:
+        """
+        Check if a file has identical content at two versions.
+
+        Git compares blob ids for committed versions and hashes the working
+        file only if its stat info differs, so no content is transferred.
+
+        Args:
+            file_path: Path to file (relative to repo root or absolute)
+            commit1: Commit hash, or None for the working directory
+            commit2: Commit hash, or None for the working directory
+
+        Returns:
+            True if the file is identical at both versions, False if it differs
+            or the comparison could not be made
+        """
+        if commit1 is None:
+            commit1, commit2 = commit2, commit1
+        if commit1 is None or not self._is_git_repo():
+            return False
+
+        rel_path = self._get_relative_path(file_path)
+        commits = [commit1] if commit2 is None else [commit1, commit2]
+
+        result = self.git_client.run_command(
+            ["git", "diff", "--quiet", *commits, "--", str(rel_path)], self.repo_root
+        )
+        # Exit code 0 means no differences (1 = differs, >1 = error)
+        return result.returncode == 0
+
     def get_current_commit_hash(self, file_path: Path) -> str | None:
         """
         Get the commit hash that the current working file matches.
@@ -269,8 +505,8 @@ class GitService:
 
         # Fast path: check if file matches HEAD
         if self.file_matches_head(file_path):
-            # Get versions list - first version is the latest commit that modified this file
-            versions = self.get_file_versions(file_path)
+            # Only the latest commit that modified this file is needed
+            versions = self.get_file_versions(file_path, max_count=1)
             if versions:
                 # Return the latest commit that modified this file, not HEAD
                 # (HEAD may not have modified this file)
@@ -282,12 +518,21 @@ class GitService:
         try:
             current_content = file_path.read_bytes()
             versions = self.get_file_versions(file_path)
+            blob_ids = self.get_blob_ids_at_commits(
+                file_path, [commit_hash for commit_hash, _, _ in versions]
+            )
 
-            # Check each version to see if content matches
-            for commit_hash, _, _ in versions:
-                commit_content = self.get_file_at_commit(file_path, commit_hash)
-                if commit_content and commit_content == current_content:
-                    return commit_hash
+            # Check each version (newest first) by comparing blob ids, so
+            # committed content never has to be read back
+            if blob_ids:
+                # SHA-256 repositories use 64-character object ids
+                sample_id = next(iter(blob_ids.values()))
+                current_blob_id = _git_blob_id(
+                    current_content, "sha256" if len(sample_id) == 64 else "sha1"
+                )
+                for commit_hash, _, _ in versions:
+                    if blob_ids.get(commit_hash) == current_blob_id:
+                        return commit_hash
         except (OSError, ValueError):
             pass
 
@@ -317,6 +562,33 @@ class GitService:
 
         return result.stdout.strip()
 
+    def set_remote_url(self, url: str, remote_name: str | None = None) -> None:
+        """
+        Point a git remote at a URL, adding the remote if it doesn't exist.
+
+        Adding is tried first since a freshly initialized repository has no
+        remotes; an existing remote is updated in place with set-url.
+
+        Args:
+            url: Remote URL
+            remote_name: Name of the remote (defaults to configured default_remote)
+
+        Raises:
+            GitCommandError: If the remote could not be added or updated
+        """
+        remote = remote_name or self.default_remote
+        result = self.git_client.run_command(
+            ["git", "remote", "add", remote, url], self.repo_root
+        )
+        if result.returncode == 0:
+            return
+
+        result = self.git_client.run_command(
+            ["git", "remote", "set-url", remote, url], self.repo_root
+        )
+        if result.returncode != 0:
+            raise GitCommandError(f"Failed to set remote '{remote}': {result.stderr}")
+
     # Publishing operations (from GitPublisher)
 
     def commit_calendar_locally(
@@ -368,9 +640,13 @@ class GitService:
             self._push_changes()
 
             # Generate and display subscription URLs (always ICS)
-            from app.storage.subscription_url_generator import SubscriptionUrlGenerator
+            from app.storage.subscription_url_generator import (
+                get_subscription_url_generator,
+            )
 
-            url_generator = SubscriptionUrlGenerator(self.repo_root, self.remote_url)
+            url_generator = get_subscription_url_generator(
+                self.repo_root, self.remote_url
+            )
             urls = url_generator.generate_subscription_urls(
                 calendar_name, filepath, "ics"
             )
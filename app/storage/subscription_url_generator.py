@@ -2,6 +2,7 @@
 
 import logging
 import re
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from app.storage.git_client import GitClient, SubprocessGitClient
@@ -69,7 +70,7 @@ class SubscriptionUrlGenerator:
         - https://github.com/owner/repo
         """
         # Remove .git suffix if present
-        url = remote_url.rstrip(".git")
+        url = remote_url.removesuffix(".git")
 
         # Handle SSH format: git@github.com:owner/repo
         ssh_match = re.match(r"git@github\.com:(.+?)/(.+?)$", url)
@@ -92,6 +93,24 @@ class SubscriptionUrlGenerator:
             return Path(result.stdout.strip())
         return None
 
+    @cached_property
+    def _location(self) -> tuple[str, str, str, Path | None] | None:
+        """Owner, repo, branch and repo root, looked up once per generator.
+
+        None if there is no GitHub remote. Caching these means generating
+        URLs for several calendars costs git calls only for the first.
+        """
+        remote_url = self._get_remote_url()
+        if not remote_url:
+            return None
+
+        # Parse remote URL to extract owner/repo
+        owner, repo = self._parse_remote_url(remote_url)
+        if not owner or not repo:
+            return None
+
+        return owner, repo, self._get_branch(), self._get_repo_root()
+
     def generate_subscription_urls(
         self, calendar_name: str, filepath: Path, format: str
     ) -> list[str]:
@@ -106,21 +125,13 @@ class SubscriptionUrlGenerator:
         Returns:
             List of subscription URLs (single URL for calendar.{ext})
         """
-        remote_url = self._get_remote_url()
-        if not remote_url:
-            return []
-
-        # Parse remote URL to extract owner/repo
-        owner, repo = self._parse_remote_url(remote_url)
-        if not owner or not repo:
+        location = self._location
+        if location is None:
             return []
-
-        # Get branch name
-        branch = self._get_branch()
+        owner, repo, branch, repo_root = location
 
         # URL for calendar file - calendar_dir is the repo root, so path is relative to it
         # Get relative path from repo root
-        repo_root = self._get_repo_root()
         if repo_root:
             calendar_file = self.repo_root / calendar_name / f"calendar.{format}"
             try:
@@ -137,3 +148,15 @@ class SubscriptionUrlGenerator:
         )
 
         return [calendar_url]
+
+
+@lru_cache(maxsize=4)
+def get_subscription_url_generator(
+    repo_root: Path, remote_url: str | None = None
+) -> SubscriptionUrlGenerator:
+    """Get a shared SubscriptionUrlGenerator for a repository and remote.
+
+    Reusing the generator reuses its looked-up remote, branch and repo root
+    across calendars within one process.
+    """
+    return SubscriptionUrlGenerator(repo_root, remote_url)
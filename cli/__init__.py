@@ -8,52 +8,82 @@ from app.config import CalendarConfig
 
 
 def setup_logging(
-    verbose: bool = False, quiet: bool = False, config: CalendarConfig | None = None
+    verbose: bool = False,
+    quiet: bool = False,
+    config: CalendarConfig | None = None,
+    persist_logs: bool = True,
 ) -> None:
     """Configure logging with separate formatters for file and console.
 
+    Repeat calls with the same settings are no-ops; otherwise previously
+    installed handlers are closed before the new ones are added.
+
     Args:
         verbose: If True, set console to DEBUG level
         quiet: If True, set console to ERROR level only
         config: Optional CalendarConfig for log directory/filename settings
+        persist_logs: If False, skip the log file handler (console only)
     """
-    if config is None:
-        config = CalendarConfig.from_env()
+    if quiet:
+        console_level = logging.ERROR
+    elif verbose:
+        console_level = logging.INFO
+    else:
+        # Default: only show warnings and errors (no INFO spam)
+        console_level = logging.WARNING
+
+    log_path: Path | None = None
+    if persist_logs:
+        if config is None:
+            config = CalendarConfig.from_env()
+        log_path = config.log_dir / config.log_filename
+
+    root_logger = logging.getLogger()
 
-    # File formatter: includes timestamp
-    file_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    # Skip reinstalling when our handlers are already in place for these settings
+    signature = (console_level, log_path, sys.stderr)
+    installed = [
+        h for h in root_logger.handlers if hasattr(h, "_calsync_signature")
+    ]
+    if installed and all(h._calsync_signature == signature for h in installed):
+        return
 
     # Console formatter: no timestamp, just level and message
     console_formatter = logging.Formatter("%(levelname)s: %(message)s")
 
-    # Ensure logs directory exists
-    config.log_dir.mkdir(exist_ok=True)
+    file_handler = None
+    if log_path is not None:
+        # File formatter: includes timestamp
+        file_formatter = logging.Formatter(
+            "%(asctime)s - %(levelname)s - %(message)s"
+        )
 
-    # File handler (with timestamp)
-    file_handler = logging.FileHandler(config.log_dir / config.log_filename)
-    file_handler.setFormatter(file_formatter)
-    file_handler.setLevel(logging.DEBUG)
+        # Ensure logs directory exists
+        log_path.parent.mkdir(exist_ok=True)
+
+        # File handler (with timestamp)
+        file_handler = logging.FileHandler(log_path)
+        file_handler.setFormatter(file_formatter)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler._calsync_signature = signature
 
     # Console handler - level based on flags
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setFormatter(console_formatter)
-
-    if quiet:
-        console_handler.setLevel(logging.ERROR)
-    elif verbose:
-        console_handler.setLevel(logging.INFO)
-    else:
-        # Default: only show warnings and errors (no INFO spam)
-        console_handler.setLevel(logging.WARNING)
+    console_handler.setLevel(console_level)
+    console_handler._calsync_signature = signature
 
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
 
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers to avoid duplicates, releasing open log files
+    for handler in root_logger.handlers:
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
     root_logger.handlers.clear()
 
-    root_logger.addHandler(file_handler)
+    if file_handler is not None:
+        root_logger.addHandler(file_handler)
     root_logger.addHandler(console_handler)
 
 
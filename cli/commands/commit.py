@@ -10,6 +10,9 @@ from cli.context import get_context
 
 logger = logging.getLogger(__name__)
 
+# Styled status prefix, built once rather than on every call
+_OK_PREFIX = typer.style("✓", fg=typer.colors.GREEN, bold=True)
+
 
 def commit_command(
     calendar_name: Annotated[
@@ -59,7 +62,7 @@ def commit_command(
     try:
         git_service.commit_calendar_locally(calendar_name, message=message)
 
-        print(f"{typer.style('✓', fg=typer.colors.GREEN, bold=True)} Committed to git")
+        print(f"{_OK_PREFIX} Committed to git")
         print(f"  Calendar: {calendar_name}")
 
         logger.info(f"Committed calendar '{calendar_name}' to git")
@@ -11,15 +11,21 @@ from cli.display import console
 
 def _find_env_file() -> Path | None:
     """Find .env file by searching current directory and parent directories."""
-    current = Path.cwd()
+    path = Path.cwd()
 
-    # Check current directory and all parent directories
-    for path in [current] + list(current.parents):
+    # Walk upward, opening .env optimistically at each level (EAFP)
+    while True:
         env_file = path / ".env"
-        if env_file.exists():
-            return env_file.resolve()
-
-    return None
+        try:
+            os.close(os.open(env_file, os.O_RDONLY))
+        except FileNotFoundError:
+            if path.parent == path:
+                return None
+            path = path.parent
+            continue
+        except PermissionError:
+            pass  # Present but unreadable; still report its location
+        return env_file.resolve()
 
 
 def _get_source(env_key: str, value, default_value) -> str:
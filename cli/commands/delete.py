@@ -9,6 +9,11 @@ from cli.context import get_context
 
 logger = logging.getLogger(__name__)
 
+# Styled status prefixes, built once rather than on every call
+_OK_PREFIX = typer.style("✓", fg=typer.colors.GREEN, bold=True)
+_WARN_PREFIX = typer.style("⚠", fg=typer.colors.YELLOW, bold=True)
+
+
 def delete(
     name: Annotated[
         str,
@@ -45,7 +50,7 @@ def delete(
 
         if purge_history:
             print(
-                f"\n{typer.style('⚠', fg=typer.colors.YELLOW, bold=True)} "
+                f"\n{_WARN_PREFIX} "
                 "This will permanently remove from git history (rewrites history)"
             )
         else:
@@ -66,7 +71,7 @@ def delete(
             if paths.directory.exists():
                 repository.delete_calendar(name)
             print(
-                f"\n{typer.style('✓', fg=typer.colors.GREEN, bold=True)} "
+                f"\n{_OK_PREFIX} "
                 f"Calendar '{name}' purged from git history"
             )
         else:
@@ -79,7 +84,7 @@ def delete(
         # Then commit the deletion to git (git add -A stages the deletions)
         git_service.commit_deletion(name)
         print(
-            f"\n{typer.style('✓', fg=typer.colors.GREEN, bold=True)} "
+            f"\n{_OK_PREFIX} "
             f"Calendar '{name}' deleted (archived in git history)"
         )
 
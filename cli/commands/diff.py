@@ -1,6 +1,11 @@
 """Compare calendar versions."""
 
 import logging
+import re
+from bisect import bisect_left
+from collections import defaultdict, deque
+from datetime import time
+from operator import attrgetter
 from typing import Any
 
 import typer
@@ -13,16 +18,38 @@ from cli.display.diff_renderer import DiffRenderer
 
 logger = logging.getLogger(__name__)
 
+# Stored event fields (computed fields like is_all_day derive from these)
+_EVENT_FIELDS = tuple(Event.model_fields)
+_event_values = attrgetter(*_EVENT_FIELDS)
+
+# Version specifiers that refer to the working directory
+_WORKING_ALIASES = frozenset({"working", "work", "current", "local"})
+
+# Version number specifier: "#3" or "3"
+_VERSION_NUM_RE = re.compile(r"#?(\d+)")
+
+# Used for sorting events without a start time (all-day events sort to beginning of day)
+_SORT_TIME_FALLBACK = time(0, 0)
+
+
+def _chronological_key(event: Event) -> tuple:
+    """Sort key used to order diff results for display."""
+    return (event.date, event.start or _SORT_TIME_FALLBACK)
+
 
 def _resolve_version(
     commit: str,
     versions: list[tuple[str, Any, str]],
+    sorted_hashes: list[str] | None = None,
 ) -> tuple[str | None, str]:
     """Resolve a version specifier to a commit hash.
 
     Args:
         commit: Version specifier (#N, N, latest, previous, HEAD, working, or commit hash)
         versions: List of (commit_hash, commit_date, commit_message) tuples
+        sorted_hashes: Sorted commit hashes from versions, for prefix lookup.
+            Built on demand if not provided; pass one in when resolving
+            several specifiers against the same history.
 
     Returns:
         Tuple of (commit_hash or None for working, display_name)
@@ -31,7 +58,7 @@ def _resolve_version(
     commit_lower = commit.lower()
 
     # Special case: working directory (current unsaved state)
-    if commit_lower in ("working", "work", "current", "local"):
+    if commit_lower in _WORKING_ALIASES:
         return None, "working"
 
     # Special case: HEAD (latest committed version)
@@ -41,22 +68,12 @@ def _resolve_version(
         return versions[0][0], f"HEAD ({versions[0][0][:7]})"
 
     # Check for version number (#3 or 3)
-    if commit.startswith("#"):
-        try:
-            version_num = int(commit[1:])
-            if 1 <= version_num <= len(versions):
-                target = versions[version_num - 1][0]
-                return target, f"#{version_num} ({target[:7]})"
-        except ValueError:
-            pass
-    elif commit.isdigit():
-        try:
-            version_num = int(commit)
-            if 1 <= version_num <= len(versions):
-                target = versions[version_num - 1][0]
-                return target, f"#{version_num} ({target[:7]})"
-        except ValueError:
-            pass
+    match = _VERSION_NUM_RE.fullmatch(commit)
+    if match:
+        version_num = int(match.group(1))
+        if 1 <= version_num <= len(versions):
+            target = versions[version_num - 1][0]
+            return target, f"#{version_num} ({target[:7]})"
 
     # Relative commands
     if commit_lower == "latest":
@@ -70,10 +87,15 @@ def _resolve_version(
             return target, f"previous ({target[:7]})"
         raise typer.BadParameter(f"Only {len(versions)} version(s) available")
 
-    # Treat as commit hash - find matching commit
-    for v_hash, _, _ in versions:
-        if v_hash.startswith(commit):
-            return v_hash, v_hash[:7]
+    # Treat as commit hash prefix - binary search the sorted hashes
+    if sorted_hashes is None:
+        sorted_hashes = sorted(v_hash for v_hash, _, _ in versions)
+    idx = bisect_left(sorted_hashes, commit)
+    if idx < len(sorted_hashes) and sorted_hashes[idx].startswith(commit):
+        if idx + 1 < len(sorted_hashes) and sorted_hashes[idx + 1].startswith(commit):
+            raise typer.BadParameter(f"Version '{commit}' is ambiguous")
+        v_hash = sorted_hashes[idx]
+        return v_hash, v_hash[:7]
 
     raise typer.BadParameter(f"Version '{commit}' not found")
 
@@ -106,6 +128,10 @@ def _compute_diff(
 ) -> tuple[list, list, list]:
     """Compute differences between two calendars or event lists.
 
+    Events are matched in their original order, so events sharing a date
+    and title pair up in file order. Every returned list is then sorted for
+    display (modified by the new event's date and time).
+
     Returns:
         Tuple of (added_events, removed_events, modified_events)
         modified_events is a list of (old_event, new_event) tuples
@@ -125,91 +151,67 @@ def _compute_diff(
     else:
         new_events = new
 
-    # Create lookup by (date, title, start, end) as the primary key
-    def event_key(e):
-        return (e.date, e.title, e.start, e.end)
-
-    # Secondary key for detecting modifications (date + title only)
-    def event_identity(e):
-        return (e.date, e.title)
-
-    old_by_key = {event_key(e): e for e in old_events}
-    new_by_key = {event_key(e): e for e in new_events}
-
-    old_by_identity = {}
+    # Index old events in one pass: exact lookup by (date, title, start, end),
+    # plus queues per (date, title) identity for detecting modifications.
+    # Matched events are popped off the front of their identity queue.
+    old_by_key = {}
+    old_by_identity = defaultdict(deque)
     for e in old_events:
-        identity = event_identity(e)
-        if identity not in old_by_identity:
-            old_by_identity[identity] = []
-        old_by_identity[identity].append(e)
-
-    new_by_identity = {}
-    for e in new_events:
-        identity = event_identity(e)
-        if identity not in new_by_identity:
-            new_by_identity[identity] = []
-        new_by_identity[identity].append(e)
+        old_by_key[(e.date, e.title, e.start, e.end)] = e
+        old_by_identity[(e.date, e.title)].append(e)
 
     added = []
-    removed = []
     modified = []
-    processed_old = set()
-    processed_new = set()
+    unmatched = []
+
+    # Old events not yet matched; popping a key marks it as consumed
+    old_remaining = dict(old_by_key)
 
     # FIRST PASS: Process exact matches first to avoid greedy modification matching
     for event in new_events:
-        key = event_key(event)
-        if key in old_by_key:
-            old_event = old_by_key[key]
+        key = (event.date, event.title, event.start, event.end)
+        old_event = old_remaining.pop(key, None)
+        if old_event is not None:
             # Check if they actually differ (e.g., type changed)
             if _events_differ(old_event, event):
                 modified.append((old_event, event))
-            processed_old.add(key)
-            processed_new.add(key)
-
-    # SECOND PASS: Find added and modified events (only for unprocessed new events)
-    for event in new_events:
-        key = event_key(event)
-        if key in processed_new:
-            # Already handled as exact match
-            continue
+        elif key not in old_by_key:
+            unmatched.append(event)
+        # Otherwise: duplicate of an exact match already handled
 
+    # SECOND PASS: Find added and modified events (only for unmatched new events)
+    for event in unmatched:
         # Check if there's a similar event (same date and title) that was modified
-        identity = event_identity(event)
-        if identity in old_by_identity:
-            # Find first unprocessed old event with same identity
-            old_matches = old_by_identity[identity]
-            found_match = False
-            for old_event in old_matches:
-                old_key = event_key(old_event)
-                if old_key not in processed_old:
-                    # Found a modification
-                    if _events_differ(old_event, event):
-                        modified.append((old_event, event))
-                    processed_old.add(old_key)
-                    processed_new.add(key)
-                    found_match = True
-                    break
-            if not found_match:
-                added.append(event)
+        old_matches = old_by_identity.get((event.date, event.title))
+        while old_matches:
+            # Skip old events already consumed as exact matches
+            old_event = old_matches.popleft()
+            old_key = (old_event.date, old_event.title, old_event.start, old_event.end)
+            if old_remaining.pop(old_key, None) is not None:
+                if _events_differ(old_event, event):
+                    modified.append((old_event, event))
+                break
         else:
             # Truly new event
             added.append(event)
 
-    # Find removed events (in old but not processed)
-    for event in old_events:
-        key = event_key(event)
-        if key not in processed_old and key not in new_by_key:
-            removed.append(event)
+    # Removed events: old events whose key was never consumed
+    removed = [
+        e for e in old_events if (e.date, e.title, e.start, e.end) in old_remaining
+    ]
+
+    # Sort results for display; stable sorts keep file order among ties
+    added.sort(key=_chronological_key)
+    removed.sort(key=_chronological_key)
+    modified.sort(key=lambda pair: _chronological_key(pair[1]))
 
     return added, removed, modified
 
 
 def _events_differ(old, new) -> bool:
     """Check if two events differ in meaningful ways."""
-    # Exclude computed fields from comparison
-    exclude = {"is_all_day", "is_overnight"}
-    return old.model_dump(exclude=exclude) != new.model_dump(exclude=exclude)
+    # Compare stored field values directly instead of serializing both models
+    return _event_values(old) != _event_values(new)
 
 
 def diff(
@@ -272,9 +274,10 @@ def diff(
         raise typer.Exit(0)
 
     # Resolve version specifiers
+    sorted_hashes = sorted(v_hash for v_hash, _, _ in versions)
     try:
-        commit1, display1 = _resolve_version(version1, versions)
-        commit2, display2 = _resolve_version(version2, versions)
+        commit1, display1 = _resolve_version(version1, versions, sorted_hashes)
+        commit2, display2 = _resolve_version(version2, versions, sorted_hashes)
     except typer.BadParameter as e:
         logger.error(str(e))
         raise typer.Exit(1)
@@ -284,6 +287,14 @@ def diff(
         renderer.render_same_version(display1)
         raise typer.Exit(0)
 
+    # Byte-identical versions can't differ; skip loading and diffing entirely
+    if repository.git_service.file_unchanged_between(
+        repository.paths(name).data, commit1, commit2
+    ):
+        renderer.render_comparison_header(name, display1, display2)
+        renderer.render_no_differences()
+        raise typer.Exit(0)
+
     # Load calendars at each version
     cal1 = _get_calendar_at_version(repository, name, commit1)
     cal2 = _get_calendar_at_version(repository, name, commit2)
@@ -2,17 +2,67 @@
 
 import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
 
 import typer
 from typing_extensions import Annotated
 
 from app.exceptions import CalendarNotFoundError, ExportError
+from app.models.calendar import Calendar
+from app.models.template import CalendarTemplate
 from app.models.template_loader import get_template
 from cli.context import get_context
 
 logger = logging.getLogger(__name__)
 
 
+class _TemplateResolver:
+    """Resolve export templates, remembering misses as well as hits.
+
+    Template choice follows the same precedence for every export: the
+    --template override, then the calendar's own template_name, then the
+    configured default. get_template already caches loaded templates, but a
+    missing template is looked up on disk again every time; this cache also
+    records misses. Safe to share between export worker threads.
+    """
+
+    def __init__(
+        self,
+        template_dir: Path,
+        default_template: str | None = None,
+        override: str | None = None,
+    ):
+        self.template_dir = template_dir
+        self.default_template = default_template
+        self.override = override
+        self._cache: dict[str, CalendarTemplate | None] = {}
+        self._lock = threading.Lock()
+
+    def for_calendar(self, calendar: Calendar) -> tuple[str | None, CalendarTemplate | None]:
+        """Return the effective template name for a calendar and its template.
+
+        The template is None if no name applies or the named template is missing.
+        """
+        template_name = self.override or calendar.template_name or self.default_template
+        return template_name, self.resolve(template_name)
+
+    def resolve(self, template_name: str | None) -> CalendarTemplate | None:
+        """Return the named template, or None if unset or not found."""
+        if not template_name:
+            return None
+        with self._lock:
+            if template_name not in self._cache:
+                try:
+                    template = get_template(template_name, self.template_dir)
+                except FileNotFoundError:
+                    template = None
+                self._cache[template_name] = template
+            return self._cache[template_name]
+
+
 def export_command(
     calendar_name: Annotated[
         str,
@@ -39,31 +89,27 @@ def export_command(
     repository = ctx.repository
 
     # Load calendar to check if it exists and get metadata
-    calendar_with_metadata = repository.load_calendar(calendar_name)
-    if calendar_with_metadata is None:
+    calendar = repository.load_calendar(calendar_name)
+    if calendar is None:
         logger.error(f"Calendar '{calendar_name}' not found")
         sys.exit(1)
 
-    metadata = calendar_with_metadata.metadata
-
     # Determine template to use
-    effective_template_name = template_name or metadata.template_name or config.default_template
-    template = None
-    
-    if effective_template_name:
-        try:
-            template = get_template(effective_template_name, config.template_dir)
-            logger.info(f"Using template: {template.name} (version {template.version})")
-        except FileNotFoundError:
-            logger.warning(f"Template '{effective_template_name}' not found, exporting without template")
-            template = None
+    templates = _TemplateResolver(config.template_dir, config.default_template, template_name)
+    effective_template_name, template = templates.for_calendar(calendar)
+
+    if template:
+        logger.info(f"Using template: {template.name} (version {template.version})")
+    elif effective_template_name:
+        logger.warning(f"Template '{effective_template_name}' not found, exporting without template")
 
     # Export to ICS
     try:
-        ics_path = repository.export_ics(calendar_name, template=template)
+        ics_path = repository.export_ics(calendar_name, template=template, calendar=calendar)
         
         print(f"{typer.style('✓', fg=typer.colors.GREEN, bold=True)} Exported ICS")
-        print(f"  {ics_path.resolve()}")
+        # Paths under an absolute calendar_dir need no resolve() stat walk
+        print(f"  {ics_path if ics_path.is_absolute() else ics_path.resolve()}")
         
         if template:
             print(f"  Template: {template.name} (v{template.version})")
@@ -89,57 +135,73 @@ def export_all_command(
             "--template", "-t", help="Template name for resolving location_id"
         ),
     ] = None,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs", "-j", min=1, help="Number of calendars to export in parallel (default: auto)"
+        ),
+    ] = None,
 ) -> None:
     """
     Export all calendars to ICS format.
     
-    Iterates through all calendars and exports each one to ICS.
+    Exports calendars concurrently; results are listed in name order.
     """
     ctx = get_context()
     repository = ctx.repository
 
-    calendars = repository.list_calendars()
-    if not calendars:
+    # Stream names from the directory scan so exports start before it finishes
+    calendars = repository.iter_calendars()
+    first = next(calendars, None)
+    if first is None:
         print("No calendars found.")
         return
 
-    print(f"Exporting {len(calendars)} calendars...")
-    
     success = 0
     failed = 0
-    
-    for calendar_name in calendars:
-        try:
-            # Load calendar to get metadata
-            calendar_with_metadata = repository.load_calendar(calendar_name)
-            if calendar_with_metadata is None:
-                logger.warning(f"Skipping '{calendar_name}': not found")
+
+    # Calendars commonly share a template; resolve each name only once
+    config = ctx.config
+    templates = _TemplateResolver(config.template_dir, config.default_template, template_name)
+
+    def export_one(calendar_name: str) -> bool:
+        """Export a single calendar; returns False if it could not be loaded."""
+        # Load calendar once; it supplies the template name and is then exported
+        calendar = repository.load_calendar(calendar_name)
+        if calendar is None:
+            logger.warning(f"Skipping '{calendar_name}': not found")
+            return False
+
+        _, template = templates.for_calendar(calendar)
+
+        repository.export_ics(calendar_name, template=template, calendar=calendar)
+        return True
+
+    # Exports are independent and I/O-bound; run them concurrently and
+    # report from this thread in name order, whichever finishes first
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            name: executor.submit(export_one, name) for name in chain((first,), calendars)
+        }
+        print(f"Exporting {len(futures)} calendars...")
+
+        for calendar_name in sorted(futures):
+            try:
+                exported = futures[calendar_name].result()
+            except Exception as e:
+                print(f"  {typer.style('✗', fg=typer.colors.RED)} {calendar_name}: {e}")
                 failed += 1
                 continue
 
-            metadata = calendar_with_metadata.metadata
-            
-            # Determine template
-            effective_template_name = template_name or metadata.template_name or ctx.config.default_template
-            template = None
-            
-            if effective_template_name:
-                try:
-                    template = get_template(effective_template_name, ctx.config.template_dir)
-                except FileNotFoundError:
-                    pass
-
-            # Export
-            ics_path = repository.export_ics(calendar_name, template=template)
-            print(f"  {typer.style('✓', fg=typer.colors.GREEN)} {calendar_name}")
-            success += 1
-            
-        except Exception as e:
-            print(f"  {typer.style('✗', fg=typer.colors.RED)} {calendar_name}: {e}")
-            failed += 1
+            if exported:
+                print(f"  {typer.style('✓', fg=typer.colors.GREEN)} {calendar_name}")
+                success += 1
+            else:
+                failed += 1
 
     print(f"\nExported: {success}, Failed: {failed}")
 
 
-# Alias for CLI registration
+# Aliases for CLI registration
 export = export_command
+export_all = export_all_command
@@ -1,17 +1,22 @@
 """Git setup command for initializing calendar repository."""
 
-import json
 import logging
-import re
+import os
 import shutil
+import stat
 import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import typer
 from typing_extensions import Annotated
 
+from app.exceptions import GitCommandError
 from app.storage.git_service import GitService
-from cli.context import CLIContext, get_context
+from cli.context import get_context
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +35,16 @@ def git_setup(
     """
     ctx = get_context()
     config = ctx.config
+    # Resolve once; everything below reuses these
     calendar_dir = config.calendar_dir.resolve()
+    git_dir = calendar_dir / ".git"
+    git_service = GitService(calendar_dir)
+    # Decide once whether we can ask questions; scripted runs take the defaults
+    interactive = _is_interactive()
 
     # Handle delete mode
     if delete:
-        _delete_git_repository(calendar_dir)
+        _delete_git_repository(calendar_dir, git_dir, git_service, interactive)
         return
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -48,8 +58,8 @@ def git_setup(
     # ─────────────────────────────────────────────────────────────────────────
     # Check existing repository
     # ─────────────────────────────────────────────────────────────────────────
-    if (calendar_dir / ".git").exists():
-        git_service = GitService(calendar_dir)
+    just_initialized = not git_dir.exists()
+    if not just_initialized:
         remote_url = git_service.get_remote_url()
         if remote_url:
             print("\nRepository already configured:")
@@ -64,12 +74,7 @@ def git_setup(
         print("  Creating git repository...", end=" ", flush=True)
         calendar_dir.mkdir(parents=True, exist_ok=True)
         try:
-            subprocess.run(
-                ["git", "init"],
-                cwd=calendar_dir,
-                check=True,
-                capture_output=True,
-            )
+            _run_git(["init"], calendar_dir)
             print(typer.style("done", fg=typer.colors.GREEN))
         except subprocess.CalledProcessError as e:
             print(typer.style("failed", fg=typer.colors.RED))
@@ -82,27 +87,33 @@ def git_setup(
     remote_url = None
 
     # Tier 1: Try GitHub CLI first (most seamless)
-    if _check_gh_cli_available():
-        username = _get_github_username_from_gh()
-        if username:
-            print(f"\nGitHub CLI detected (user: {username})")
-            default_repo_name = "calendar-sync-calendars"
+    username = _probe_gh()
+    if username:
+        print(f"\nGitHub CLI detected (user: {username})")
+        default_repo_name = "calendar-sync-calendars"
+        if interactive:
             response = typer.prompt("Repository name", default=default_repo_name)
+        else:
+            response = default_repo_name
 
-            repo_name = response if response else default_repo_name
-            full_repo_name = f"{username}/{repo_name}"
+        repo_name = response if response else default_repo_name
+        full_repo_name = f"{username}/{repo_name}"
 
-            print(f"\n  Creating GitHub repository...", end=" ", flush=True)
-            if _create_repo_with_gh(username, repo_name, calendar_dir):
-                remote_url = f"https://github.com/{username}/{repo_name}.git"
-                print(typer.style("done", fg=typer.colors.GREEN))
+        print(f"\n  Creating GitHub repository...", end=" ", flush=True)
+        if _create_repo_with_gh(username, repo_name, calendar_dir):
+            remote_url = f"https://github.com/{username}/{repo_name}.git"
+            print(typer.style("done", fg=typer.colors.GREEN))
 
     # Tier 2: Manual fallback
     if not remote_url:
         print("\nCould not auto-detect GitHub settings.")
-        manual_url = typer.prompt(
-            "Enter GitHub repository URL (or press Enter to skip)",
-            default="",
+        manual_url = (
+            typer.prompt(
+                "Enter GitHub repository URL (or press Enter to skip)",
+                default="",
+            )
+            if interactive
+            else ""
         )
         if manual_url:
             remote_url = manual_url
@@ -111,25 +122,12 @@ def git_setup(
     if remote_url:
         print("  Configuring remote...", end=" ", flush=True)
         try:
-            # Remove existing remote if it exists
-            subprocess.run(
-                ["git", "remote", "remove", "origin"],
-                cwd=calendar_dir,
-                capture_output=True,
-                check=False,
-            )
-            # Add new remote
-            subprocess.run(
-                ["git", "remote", "add", "origin", remote_url],
-                cwd=calendar_dir,
-                check=True,
-                capture_output=True,
-            )
+            git_service.set_remote_url(remote_url)
             print(typer.style("done", fg=typer.colors.GREEN))
 
             # Save to .env file
             _write_to_env_file("CALENDAR_GIT_REMOTE_URL", remote_url)
-        except subprocess.CalledProcessError as e:
+        except GitCommandError as e:
             print(typer.style("failed", fg=typer.colors.RED))
             logger.warning(f"Failed to set remote: {e}")
             print("  Warning: Could not configure remote. Set it manually later.")
@@ -137,32 +135,22 @@ def git_setup(
     # ─────────────────────────────────────────────────────────────────────────
     # Initial commit
     # ─────────────────────────────────────────────────────────────────────────
-    if calendar_dir.exists():
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=calendar_dir,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.stdout.strip():
-            print("  Creating initial commit...", end=" ", flush=True)
-            try:
-                subprocess.run(
-                    ["git", "add", "."],
-                    cwd=calendar_dir,
-                    check=True,
-                    capture_output=True,
-                )
-                subprocess.run(
-                    ["git", "commit", "-m", "Initial calendar repository"],
-                    cwd=calendar_dir,
-                    check=True,
-                    capture_output=True,
+    # calendar_dir always exists here (it held .git or was just created).
+    # Stage and commit directly; a commit with nothing staged just fails,
+    # so there's no need to check git status up front. A repository we just
+    # initialized has something to commit exactly when the directory holds
+    # anything besides .git, which needs no git call to find out.
+    if not just_initialized or _has_content_besides_git(calendar_dir):
+        try:
+            _run_git(["add", "."], calendar_dir)
+            _run_git(["commit", "-m", "Initial calendar repository"], calendar_dir)
+            print(f"  Creating initial commit... {typer.style('done', fg=typer.colors.GREEN)}")
+        except subprocess.CalledProcessError as e:
+            if just_initialized or _has_uncommitted_changes(calendar_dir):
+                print(
+                    f"  Creating initial commit... "
+                    f"{typer.style('skipped', fg=typer.colors.YELLOW)}"
                 )
-                print(typer.style("done", fg=typer.colors.GREEN))
-            except subprocess.CalledProcessError as e:
-                print(typer.style("skipped", fg=typer.colors.YELLOW))
                 logger.warning(f"Failed to create initial commit: {e}")
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -178,43 +166,84 @@ def git_setup(
         print("  git remote add origin <repository-url>")
 
 
+def _run_git(args: list[str], cwd: Path) -> None:
+    """Run a git command whose output isn't needed.
+
+    Output is discarded rather than captured, so no pipes are allocated.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with a non-zero status
+    """
+    subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _has_content_besides_git(calendar_dir: Path) -> bool:
+    """Check if the calendar directory contains any entry other than .git."""
+    with os.scandir(calendar_dir) as entries:
+        return any(entry.name != ".git" for entry in entries)
+
+
+def _has_uncommitted_changes(calendar_dir: Path) -> bool:
+    """Check if the calendar repository has any uncommitted changes."""
+    result = subprocess.run(
+        ["git", "status", "--porcelain"],
+        cwd=calendar_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        check=False,
+    )
+    return bool(result.stdout.strip())
+
+
+def _probe_gh() -> str | None:
+    """Get the GitHub username if gh CLI is installed and authenticated.
+
+    gh api user fails when gh is not authenticated, so a successful lookup
+    answers both questions with a single network round-trip.
+    """
+    if not _check_gh_cli_available():
+        return None
+    return _get_github_username_from_gh()
+
+
+def _is_interactive() -> bool:
+    """Check if prompts can be answered (stdin is a terminal and not running in CI)."""
+    return sys.stdin.isatty() and not os.environ.get("CI")
+
+
+@lru_cache(maxsize=1)
 def _check_gh_cli_available() -> bool:
-    """Check if GitHub CLI is installed and authenticated."""
-    try:
-        # Check if gh is installed
-        result = subprocess.run(
-            ["gh", "--version"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            return False
+    """Check if GitHub CLI is installed.
 
-        # Check if authenticated
-        auth_result = subprocess.run(
-            ["gh", "auth", "status"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        return auth_result.returncode == 0
-    except Exception:
-        return False
+    This is a local PATH lookup; authentication is confirmed by the gh call
+    that follows (which fails if gh is not logged in).
+    """
+    return shutil.which("gh") is not None
 
 
+@lru_cache(maxsize=1)
 def _get_github_username_from_gh() -> str | None:
-    """Get GitHub username from gh CLI."""
+    """Get GitHub username from gh CLI.
+
+    The result is cached for the life of the process.
+    """
     try:
+        # Let gh extract the login field rather than decoding the whole payload
         result = subprocess.run(
-            ["gh", "api", "user"],
-            capture_output=True,
+            ["gh", "api", "user", "-q", ".login"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True,
         )
-        # Parse JSON to get login
-        user_data = json.loads(result.stdout)
-        return user_data.get("login")
+        return result.stdout.strip() or None
     except Exception:
         return None
 
@@ -235,8 +264,8 @@ def _create_repo_with_gh(username: str, repo_name: str, calendar_dir: Path) -> b
                 "--remote",
                 "origin",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
         return result.returncode == 0
@@ -244,8 +273,14 @@ def _create_repo_with_gh(username: str, repo_name: str, calendar_dir: Path) -> b
         return False
 
 
-def _delete_git_repository(calendar_dir: Path) -> None:
-    """Delete local and remote git repository with confirmation."""
+def _delete_git_repository(
+    calendar_dir: Path, git_dir: Path, git_service: GitService, interactive: bool = True
+) -> None:
+    """Delete local and remote git repository with confirmation.
+
+    Without an interactive terminal the confirmation takes its default (no),
+    so deletion is cancelled rather than blocking on input.
+    """
     # ─────────────────────────────────────────────────────────────────────────
     # Header
     # ─────────────────────────────────────────────────────────────────────────
@@ -254,13 +289,11 @@ def _delete_git_repository(calendar_dir: Path) -> None:
     print(f"{'━' * 40}")
 
     # Check if git repo exists
-    git_dir = calendar_dir / ".git"
     if not git_dir.exists():
         print(f"\nNo git repository found in {calendar_dir}")
         return
 
     # Get remote URL if it exists
-    git_service = GitService(calendar_dir)
     remote_url = git_service.get_remote_url()
 
     # Show what will be deleted
@@ -276,50 +309,61 @@ def _delete_git_repository(calendar_dir: Path) -> None:
 
     # Confirmation prompt
     print()
-    if not typer.confirm("Are you sure you want to delete the git repository?"):
+    if not interactive or not typer.confirm(
+        "Are you sure you want to delete the git repository?"
+    ):
         print("Deletion cancelled.")
         return
 
-    # ─────────────────────────────────────────────────────────────────────────
-    # Delete remote repository
-    # ─────────────────────────────────────────────────────────────────────────
     print("\nDeleting...")
 
-    if remote_url:
-        repo_name = _extract_repo_name_from_url(remote_url)
-        if repo_name and _check_gh_cli_available():
-            print(f"  Deleting remote repository...", end=" ", flush=True)
-            success, error_msg = _delete_remote_repo(repo_name)
-            if success:
-                print(typer.style("done", fg=typer.colors.GREEN))
-            else:
-                print(typer.style("failed", fg=typer.colors.RED))
-                if error_msg:
-                    if (
-                        "delete_repo" in error_msg.lower()
-                        or "admin rights" in error_msg.lower()
-                    ):
-                        print("\n  GitHub CLI needs 'delete_repo' scope. Run:")
-                        print("    gh auth refresh -h github.com -s delete_repo")
-                    else:
-                        print(f"  Error: {error_msg}")
-                print("  Delete manually on GitHub if needed.")
+    repo_name = _extract_repo_name_from_url(remote_url) if remote_url else None
+    delete_remote = repo_name is not None and _check_gh_cli_available()
+
+    # The remote delete is a network call and the local delete is disk-bound;
+    # neither depends on the other, so run them together and report after
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        remote_future = (
+            executor.submit(_delete_remote_repo, repo_name) if delete_remote else None
+        )
+        local_future = executor.submit(shutil.rmtree, git_dir)
+        local_error = local_future.exception()
+        remote_result = remote_future.result() if remote_future else None
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Remote repository result
+    # ─────────────────────────────────────────────────────────────────────────
+    if remote_result is not None:
+        success, error_msg = remote_result
+        print("  Deleting remote repository...", end=" ")
+        if success:
+            print(typer.style("done", fg=typer.colors.GREEN))
         else:
-            print(f"  Remote: {remote_url}")
-            print("  (Delete manually on GitHub if needed)")
+            print(typer.style("failed", fg=typer.colors.RED))
+            if error_msg:
+                if (
+                    "delete_repo" in error_msg.lower()
+                    or "admin rights" in error_msg.lower()
+                ):
+                    print("\n  GitHub CLI needs 'delete_repo' scope. Run:")
+                    print("    gh auth refresh -h github.com -s delete_repo")
+                else:
+                    print(f"  Error: {error_msg}")
+            print("  Delete manually on GitHub if needed.")
+    elif remote_url:
+        print(f"  Remote: {remote_url}")
+        print("  (Delete manually on GitHub if needed)")
 
     # ─────────────────────────────────────────────────────────────────────────
-    # Delete local repository
+    # Local repository result
     # ─────────────────────────────────────────────────────────────────────────
-    print("  Deleting local repository...", end=" ", flush=True)
-    try:
-        shutil.rmtree(git_dir)
-        print(typer.style("done", fg=typer.colors.GREEN))
-    except Exception as e:
+    print("  Deleting local repository...", end=" ")
+    if local_error is not None:
         print(typer.style("failed", fg=typer.colors.RED))
-        logger.error(f"Failed to delete local git repository: {e}")
-        print(f"  Error: {e}")
+        logger.error(f"Failed to delete local git repository: {local_error}")
+        print(f"  Error: {local_error}")
         raise typer.Exit(1)
+    print(typer.style("done", fg=typer.colors.GREEN))
 
     # Remove remote URL from .env file if it exists
     if remote_url:
@@ -331,20 +375,23 @@ def _delete_git_repository(calendar_dir: Path) -> None:
     print(f"\n{typer.style('Deletion complete', bold=True)}")
 
 
+# URL prefixes for GitHub remotes (SSH and HTTPS)
+_GITHUB_URL_PREFIXES = ("git@github.com:", "https://github.com/", "http://github.com/")
+
+
 def _extract_repo_name_from_url(remote_url: str) -> str | None:
     """Extract repository name (owner/repo) from GitHub URL."""
     # Remove .git suffix if present
-    url = remote_url.rstrip(".git")
+    url = remote_url.removesuffix(".git")
 
-    # Handle SSH format: git@github.com:owner/repo
-    ssh_match = re.match(r"git@github\.com:(.+?)/(.+?)$", url)
-    if ssh_match:
-        return f"{ssh_match.group(1)}/{ssh_match.group(2)}"
-
-    # Handle HTTPS format: https://github.com/owner/repo
-    https_match = re.match(r"https?://github\.com/(.+?)/(.+?)$", url)
-    if https_match:
-        return f"{https_match.group(1)}/{https_match.group(2)}"
+    # Handle SSH (git@github.com:owner/repo) and HTTPS (https://github.com/owner/repo)
+    for prefix in _GITHUB_URL_PREFIXES:
+        if url.startswith(prefix):
+            owner, _, rest = url[len(prefix):].partition("/")
+            repo = rest.split("/", 1)[0]
+            if owner and repo:
+                return f"{owner}/{repo}"
+            return None
 
     return None
 
@@ -374,40 +421,104 @@ def _delete_remote_repo(full_repo_name: str) -> tuple[bool, str]:
         return False, str(e)
 
 
-def _remove_from_env_file(key: str) -> None:
-    """Remove a key from .env file."""
-    env_file = Path(".env")
-    if not env_file.exists():
-        return
+class _EnvFile:
+    """Read-modify-write view of a .env file.
+
+    The file is read once on construction and written once by save(). New
+    keys are appended to the end of the file; updates and removals replace
+    it atomically. Comments and unrelated lines are kept as-is.
+    """
 
-    env_content = env_file.read_text()
-    lines = env_content.splitlines()
-    updated_lines = [line for line in lines if not line.startswith(f"{key}=")]
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            text = path.read_text()
+        except FileNotFoundError:
+            text = ""
+        self._lines = text.splitlines()
+        self._index = self._build_index()
+        # Lines before this index are already on disk
+        self._saved_count = len(self._lines)
+        self._ends_with_newline = not text or text.endswith("\n")
+        self._rewrite = False
+
+    def _build_index(self) -> dict[str, int]:
+        """Map each key to the line index of its first assignment."""
+        index: dict[str, int] = {}
+        for i, line in enumerate(self._lines):
+            key, sep, _ = line.partition("=")
+            if sep:
+                index.setdefault(key, i)
+        return index
+
+    def set(self, key: str, value: str) -> None:
+        """Update key in place, or append it if not present."""
+        line = f"{key}={value}"
+        i = self._index.get(key)
+        if i is None:
+            self._index[key] = len(self._lines)
+            self._lines.append(line)
+        else:
+            self._lines[i] = line
+            self._rewrite = True
 
-    if len(updated_lines) < len(lines):
-        env_file.write_text("\n".join(updated_lines) + "\n")
+    def pop(self, key: str) -> bool:
+        """Remove every assignment of key. Returns True if any were removed."""
+        if key not in self._index:
+            return False
+        prefix = f"{key}="
+        self._lines = [line for line in self._lines if not line.startswith(prefix)]
+        self._index = self._build_index()
+        self._rewrite = True
+        return True
+
+    def save(self) -> None:
+        """Write any changes: append new keys, or replace the file if lines changed."""
+        if self._rewrite:
+            self._replace()
+        elif len(self._lines) > self._saved_count:
+            self._append(self._lines[self._saved_count :])
+        else:
+            return
+
+        self._saved_count = len(self._lines)
+        self._ends_with_newline = True
+        self._rewrite = False
+
+    def _append(self, lines: list[str]) -> None:
+        """Append lines to the end of the file (creating it if needed)."""
+        with open(self.path, "a") as f:
+            if not self._ends_with_newline:
+                f.write("\n")
+            f.write("\n".join(lines) + "\n")
+
+    def _replace(self) -> None:
+        """Atomically replace the file with the current lines."""
+        directory = self.path.parent
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".env.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write("\n".join(self._lines) + "\n")
+            # mkstemp creates the file 0600; keep the existing file's permissions
+            try:
+                os.chmod(tmp_name, stat.S_IMODE(os.stat(self.path).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def _remove_from_env_file(key: str) -> None:
+    """Remove a key from .env file."""
+    env = _EnvFile(Path(".env"))
+    if env.pop(key):
+        env.save()
 
 
 def _write_to_env_file(key: str, value: str) -> None:
     """Append or update .env file with key=value."""
-    env_file = Path(".env")
-    env_content = ""
-
-    # Read existing .env if it exists
-    if env_file.exists():
-        env_content = env_file.read_text()
-
-    # Check if key already exists
-    lines = env_content.splitlines()
-    updated = False
-    for i, line in enumerate(lines):
-        if line.startswith(f"{key}="):
-            lines[i] = f"{key}={value}"
-            updated = True
-            break
-
-    if not updated:
-        lines.append(f"{key}={value}")
-
-    # Write back to file
-    env_file.write_text("\n".join(lines) + "\n")
+    env = _EnvFile(Path(".env"))
+    env.set(key, value)
+    env.save()
@@ -1,18 +1,49 @@
 """Show calendar metadata: settings, ingestion info, git history, and subscription URL."""
 
 import logging
+from datetime import datetime, timezone
+from pathlib import Path
 
 import typer
+from rich.console import Group, RenderableType
 from rich.table import Table
+from rich.text import Text
 from typing_extensions import Annotated
 
-from app.storage.subscription_url_generator import SubscriptionUrlGenerator
+from app.storage.subscription_url_generator import get_subscription_url_generator
 from cli.context import get_context
 from cli.display import console, format_datetime, format_file_size, format_path
 
 logger = logging.getLogger(__name__)
 
 
+def _create_table() -> Table:
+    """Create a two-column label/value table for an info section."""
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column("Label", style="dim", width=18)
+    table.add_column("Value")
+    return table
+
+
+def _format_row(label: str, value: str) -> Text:
+    """Format a single label/value line aligned with _create_table's columns.
+
+    Used for one-row sections, where laying out a whole table isn't needed.
+    Long values are truncated with an ellipsis, as in a table cell.
+    """
+    row = Text.from_markup(f"  [dim]{label:<18}[/dim]    {value}", overflow="ellipsis")
+    row.no_wrap = True
+    return row
+
+
+def _file_size(path: Path) -> int | None:
+    """Get a file's size, or None if it doesn't exist."""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return None
+
+
 def info(
     name: Annotated[
         str,
@@ -37,26 +68,30 @@ def info(
         console.print(f"\n[red]Calendar '{name}' not found[/red]")
         raise typer.Exit(1)
 
-    # Load calendar (data.json) - may not exist if never ingested
-    calendar = repository.load_calendar(name)
+    # Load calendar summary (data.json) - may not exist if never ingested.
+    # Only metadata and event statistics are shown, so skip loading events
+    calendar = repository.load_calendar_summary(name)
+
+    # Sections are collected here and printed together at the end
+    output: list[RenderableType] = []
+    # One reference time so every relative time in the report agrees
+    now = datetime.now(timezone.utc)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Header
     # ─────────────────────────────────────────────────────────────────────────
     display_name = settings.name or name
-    console.print()
-    console.print("━" * 60)
-    console.print(f"[bold]  Calendar: {name}[/bold]")
-    console.print("━" * 60)
+    output.append("")
+    output.append("━" * 60)
+    output.append(f"[bold]  Calendar: {name}[/bold]")
+    output.append("━" * 60)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Calendar Info (from config.json)
     # ─────────────────────────────────────────────────────────────────────────
-    console.print("\n[bold cyan]Calendar Info[/bold cyan]")
+    output.append("\n[bold cyan]Calendar Info[/bold cyan]")
 
-    info_table = Table(show_header=False, box=None, padding=(0, 2))
-    info_table.add_column("Label", style="dim", width=18)
-    info_table.add_column("Value")
+    info_table = _create_table()
 
     info_table.add_row("ID", f"[cyan]{name}[/cyan]")
     if settings.name:
@@ -65,28 +100,28 @@ def info(
         info_table.add_row("Description", settings.description)
     if settings.template:
         info_table.add_row("Template", settings.template)
-    info_table.add_row("Created", format_datetime(settings.created))
+    info_table.add_row("Created", format_datetime(settings.created, now=now))
     info_table.add_row("Path", format_path(paths.directory))
 
-    console.print(info_table)
+    output.append(info_table)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Ingestion Info (from data.json metadata)
     # ─────────────────────────────────────────────────────────────────────────
-    console.print("\n[bold cyan]Ingestion Info[/bold cyan]")
+    output.append("\n[bold cyan]Ingestion Info[/bold cyan]")
+
+    # One stat answers both "does it exist" and "how big is it"
+    data_size = _file_size(paths.data)
 
     if calendar:
-        ingest_table = Table(show_header=False, box=None, padding=(0, 2))
-        ingest_table.add_column("Label", style="dim", width=18)
-        ingest_table.add_column("Value")
-
-        # Calculate date range from events
-        if calendar.events:
-            dates = [event.date for event in calendar.events]
-            min_date = min(dates)
-            max_date = max(dates)
+        ingest_table = _create_table()
+
+        # Date range comes from the summary, not from walking the events
+        event_dates = calendar.date_range()
+        if event_dates:
+            min_date, max_date = event_dates
             date_range = f"{min_date} to {max_date}"
-            event_count = f"{len(calendar.events):,} events"
+            event_count = f"{calendar.event_count:,} events"
         else:
             date_range = "no events"
             event_count = "0 events"
@@ -97,7 +132,7 @@ def info(
             ingest_table.add_row(
                 "Source revised", format_datetime(calendar.source_revised_at)
             )
-        ingest_table.add_row("Last updated", format_datetime(calendar.last_updated))
+        ingest_table.add_row("Last updated", format_datetime(calendar.last_updated, now=now))
         if calendar.template_name:
             template_info = calendar.template_name
             if calendar.template_version:
@@ -105,48 +140,46 @@ def info(
             ingest_table.add_row("Applied template", template_info)
 
         # Data file (canonical storage)
-        if paths.data.exists():
-            data_size = paths.data.stat().st_size
+        if data_size is not None:
             ingest_table.add_row(
                 "Data file",
                 f"{format_path(paths.data)} [dim]({format_file_size(data_size)})[/dim]",
             )
 
-        console.print(ingest_table)
+        output.append(ingest_table)
     else:
-        console.print("  [dim]No data ingested yet[/dim]")
+        output.append("  [dim]No data ingested yet[/dim]")
 
     # ─────────────────────────────────────────────────────────────────────────
     # Git Info
     # ─────────────────────────────────────────────────────────────────────────
-    console.print("\n[bold cyan]Git Info[/bold cyan]")
+    output.append("\n[bold cyan]Git Info[/bold cyan]")
 
-    versions = repository.list_calendar_versions(name)
-    commit_count = len(versions)
+    # Count, latest commit and remote in one summary; the full history is
+    # never needed here
+    history = git_service.get_file_history_summary(paths.data)
+    commit_count = history.commit_count
 
-    if commit_count > 0:
-        git_table = Table(show_header=False, box=None, padding=(0, 2))
-        git_table.add_column("Label", style="dim", width=18)
-        git_table.add_column("Value")
+    if history.latest is not None:
+        git_table = _create_table()
 
         git_table.add_row("Commits", str(commit_count))
 
         # Get latest commit info
-        latest_commit_hash, latest_commit_date, latest_commit_message = versions[0]
+        latest_commit_hash, latest_commit_date, _ = history.latest
 
         # Get current version (what's in working directory)
         current_commit_hash = None
-        if paths.data.exists():
+        if data_size is not None:
             current_commit_hash = git_service.get_current_commit_hash(paths.data)
 
         # Show current version
         if current_commit_hash:
-            current_commit_date = None
-            for commit_hash, commit_date, _ in versions:
-                if commit_hash == current_commit_hash:
-                    current_commit_date = commit_date
-                    break
-
+            # Usually the latest commit; otherwise ask git for that one commit
+            if current_commit_hash == latest_commit_hash:
+                current_commit_date = latest_commit_date
+            else:
+                current_commit_date = git_service.get_commit_date(current_commit_hash)
             if current_commit_date:
                 current_str = f"[cyan]{current_commit_hash[:7]}[/cyan] ({format_datetime(current_commit_date, include_relative=False)})"
             else:
@@ -161,59 +194,62 @@ def info(
         )
 
         # Show remote info
-        remote_url = git_service.get_remote_url()
+        remote_url = history.remote_url
         if remote_url:
             git_table.add_row("Remote", f"[dim]{remote_url}[/dim]")
         else:
             git_table.add_row("Remote", "[dim]not configured[/dim]")
 
-        console.print(git_table)
+        output.append(git_table)
     else:
-        console.print("  [dim]Not tracked in git[/dim]")
+        output.append("  [dim]Not tracked in git[/dim]")
 
     # ─────────────────────────────────────────────────────────────────────────
     # Exported Files
     # ─────────────────────────────────────────────────────────────────────────
-    console.print("\n[bold cyan]Exported Files[/bold cyan]")
-
-    ics_path = paths.export("ics")
-    if ics_path.exists():
-        export_table = Table(show_header=False, box=None, padding=(0, 2))
-        export_table.add_column("Label", style="dim", width=18)
-        export_table.add_column("Value")
-
-        ics_size = ics_path.stat().st_size
-        export_table.add_row(
-            "calendar.ics",
-            f"{format_path(ics_path)} [dim]({format_file_size(ics_size)})[/dim]",
+    output.append("\n[bold cyan]Exported Files[/bold cyan]")
+
+    ics_size = _file_size(calendar_path)
+    if ics_size is not None:
+        output.append(
+            _format_row(
+                "calendar.ics",
+                f"{format_path(calendar_path)} [dim]({format_file_size(ics_size)})[/dim]",
+            )
         )
-        console.print(export_table)
     else:
-        console.print("  [dim]No exports yet[/dim]")
+        output.append("  [dim]No exports yet[/dim]")
 
     # ─────────────────────────────────────────────────────────────────────────
     # Subscription Info
     # ─────────────────────────────────────────────────────────────────────────
-    console.print("\n[bold cyan]Subscription Info[/bold cyan]")
+    output.append("\n[bold cyan]Subscription Info[/bold cyan]")
 
-    if commit_count > 0 and calendar_path:
-        url_generator = SubscriptionUrlGenerator(
-            git_service.repo_root, git_service.remote_url
-        )
-        subscription_urls = url_generator.generate_subscription_urls(
-            name, calendar_path, "ics"
-        )
+    # Configured override first, then the git remote already looked up above;
+    # handing it to the generator saves it querying git again
+    subscription_remote = git_service.remote_url or history.remote_url
+
+    if commit_count > 0:
+        subscription_urls = []
+        if subscription_remote:
+            url_generator = get_subscription_url_generator(
+                git_service.repo_root, subscription_remote
+            )
+            subscription_urls = url_generator.generate_subscription_urls(
+                name, calendar_path, "ics"
+            )
         if subscription_urls:
-            sub_table = Table(show_header=False, box=None, padding=(0, 2))
-            sub_table.add_column("Label", style="dim", width=18)
-            sub_table.add_column("Value")
-            sub_table.add_row(
-                "URL", f"[blue underline]{subscription_urls[0]}[/blue underline]"
+            output.append(
+                _format_row(
+                    "URL", f"[blue underline]{subscription_urls[0]}[/blue underline]"
+                )
             )
-            console.print(sub_table)
         else:
-            console.print("  [dim]Not available (no remote configured)[/dim]")
+            output.append("  [dim]Not available (no remote configured)[/dim]")
     else:
-        console.print("  [dim]Not available (not published)[/dim]")
+        output.append("  [dim]Not available (not published)[/dim]")
+
+    output.append("")  # Final newline
 
-    console.print()  # Final newline
+    # Render everything in one print rather than one write per line
+    console.print(Group(*output))
@@ -2,25 +2,32 @@
 
 import logging
 import sys
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from enum import Enum
 from pathlib import Path
+from typing import Any, Callable
 
 import typer
 from typing_extensions import Annotated
 
 from app.exceptions import IngestionError, InvalidYearError, UnsupportedFormatError
 from app.ingestion.service import IngestionService
-from app.models.ingestion import IngestionContext
+from app.models.calendar import Calendar
+from app.models.event import Event
+from app.models.ingestion import IngestionContext, IngestionResult, RawIngestion
+from app.models.template import CalendarTemplate
 from app.models.template_loader import get_template
-from app.processing.calendar_manager import CalendarManager, get_default_strategy_for_source
+from app.processing.calendar_manager import get_default_strategy_for_source
 from app.processing.merge_strategies import (
     Add,
     MergeStrategy,
     ReplaceByRange,
     ReplaceByYear,
     UpsertById,
+    infer_year,
 )
+from app.storage.calendar_repository import CalendarRepository
 from cli.commands.diff import display_diff
 from cli.context import get_context
 from cli.display import SummaryRenderer, console
@@ -107,7 +114,8 @@ def ingest_command(
     You can also specify a custom date range with --replace-from and --replace-to.
 
     By default, shows a preview and prompts for confirmation before saving.
-    Use --force to skip the confirmation and save directly.
+    Use --force to skip the confirmation and save directly; the preview is
+    then reduced to event counts, as it is when output is not a terminal.
 
     Note: This only saves the JSON file. Use 'export' to generate ICS,
     and 'commit' to commit changes to git.
@@ -115,7 +123,6 @@ def ingest_command(
     ctx = get_context()
     config = ctx.config
     repository = ctx.repository
-    reader_registry = ctx.reader_registry
     renderer = SummaryRenderer()
 
     # Validate date range options
@@ -137,7 +144,9 @@ def ingest_command(
     # ─────────────────────────────────────────────────────────────────────────
     # Auto-create calendar if it doesn't exist
     # ─────────────────────────────────────────────────────────────────────────
-    if not repository.calendar_exists(calendar_name):
+    # Settings were just loaded, so only check the disk when there were none
+    # (config.json may exist but be unreadable)
+    if calendar_settings is None and not repository.calendar_exists(calendar_name):
         logger.info(f"Creating new calendar: {calendar_name}")
         repository.create_calendar(
             calendar_id=calendar_name,
@@ -147,23 +156,8 @@ def ingest_command(
     # ─────────────────────────────────────────────────────────────────────────
     # Ingest source file
     # ─────────────────────────────────────────────────────────────────────────
-    input_path = Path(calendar_data_file).expanduser().resolve()
-    ingestion_service = IngestionService(reader_registry)
-
-    try:
-        ingestion_result = ingestion_service.ingest(input_path, template)
-    except FileNotFoundError as e:
-        logger.error(str(e))
-        sys.exit(1)
-    except UnsupportedFormatError as e:
-        logger.error(str(e))
-        sys.exit(1)
-    except IngestionError as e:
-        logger.error(f"Failed to read calendar file: {e}")
-        sys.exit(1)
-    except InvalidYearError as e:
-        logger.error(f"Year validation error: {e}")
-        sys.exit(1)
+    input_path = Path(calendar_data_file).expanduser()
+    ingestion_result = _ingest_file(ctx.ingestion_service, input_path, template)
 
     # Check if calendar exists
     existing = repository.load_calendar(calendar_name)
@@ -180,48 +174,15 @@ def ingest_command(
     # Determine merge strategy
     # ─────────────────────────────────────────────────────────────────────────
     merge_strategy: MergeStrategy | None = None
-    
     if not is_new:
-        # Build merge strategy from options
-        if replace_from and replace_to:
-            # Explicit date range
-            merge_strategy = ReplaceByRange(
-                start_date=parse_date(replace_from),
-                end_date=parse_date(replace_to),
-            )
-        elif strategy:
-            # Explicit strategy choice
-            if strategy == "replace-year":
-                if year is None:
-                    # Try to infer from events
-                    from app.processing.merge_strategies import infer_year
-                    inferred = infer_year(ingestion_result.raw.events)
-                    if inferred is None:
-                        console.print(
-                            "[red]Error: Cannot infer year from multi-year source. "
-                            "Use --year to specify.[/red]"
-                        )
-                        sys.exit(1)
-                    year = inferred
-                merge_strategy = ReplaceByYear(year)
-            elif strategy == "upsert":
-                merge_strategy = UpsertById()
-            elif strategy == "add":
-                merge_strategy = Add()
-        elif year:
-            # Year specified without strategy - use ReplaceByYear
-            merge_strategy = ReplaceByYear(year)
-        else:
-            # Use default strategy for source type
-            try:
-                merge_strategy = get_default_strategy_for_source(
-                    input_path.suffix,
-                    ingestion_result.raw.events,
-                    year,
-                )
-            except InvalidYearError as e:
-                logger.error(f"Year validation error: {e}")
-                sys.exit(1)
+        merge_strategy = _resolve_strategy(
+            ingestion_result.raw.events,
+            input_path.suffix,
+            year,
+            strategy,
+            replace_from,
+            replace_to,
+        )
 
     # ─────────────────────────────────────────────────────────────────────────
     # Output: Header
@@ -246,7 +207,7 @@ def ingest_command(
     # ─────────────────────────────────────────────────────────────────────────
     # Process calendar
     # ─────────────────────────────────────────────────────────────────────────
-    manager = CalendarManager(repository)
+    manager = ctx.calendar_manager
 
     try:
         processing_result = manager.create_or_update(
@@ -256,6 +217,7 @@ def ingest_command(
             template,
             merge_strategy,
             year,
+            existing=ingestion_ctx.existing_calendar,
         )
     except InvalidYearError as e:
         logger.error(f"Year validation error: {e}")
@@ -270,25 +232,15 @@ def ingest_command(
     # ─────────────────────────────────────────────────────────────────────────
     # Output: Diff
     # ─────────────────────────────────────────────────────────────────────────
-    if ingestion_ctx.is_new:
-        display_diff(
-            None, processing_result.calendar.events, "empty", "new", compact=True
-        )
-    else:
-        display_diff(
-            ingestion_ctx.existing_calendar.events if ingestion_ctx.existing_calendar else None,
-            processing_result.calendar.events,
-            "previous",
-            "updated",
-        )
+    _display_changes(
+        ingestion_ctx.existing_calendar, processing_result.calendar, force
+    )
 
     # ─────────────────────────────────────────────────────────────────────────
     # Confirmation and Save
     # ─────────────────────────────────────────────────────────────────────────
-    confirm_or_exit("Save calendar JSON?", force)
-
     # Save calendar JSON only (no ICS export, no commit)
-    json_path = repository.save_json(processing_result.calendar)
+    json_path = _confirm_and_save_json(repository, processing_result.calendar, force)
 
     # Success message
     if ingestion_ctx.is_new:
@@ -302,19 +254,353 @@ def ingest_command(
     console.print(f"  • Run 'commit {calendar_name}' to commit to git")
 
 
+def bulk_ingest_command(
+    calendar_name: Annotated[
+        str,
+        typer.Argument(help="Calendar name to create or update"),
+    ],
+    calendar_data_files: Annotated[
+        list[str],
+        typer.Argument(help="Paths to input calendar files (DOCX, ICS, or JSON)"),
+    ],
+    year: Annotated[
+        int | None,
+        typer.Option(
+            "--year", "-y", help="Year to replace (for ReplaceByYear strategy)"
+        ),
+    ] = None,
+    strategy: Annotated[
+        StrategyChoice | None,
+        typer.Option(
+            "--strategy", "-s",
+            help="Merge strategy: replace-year (default for Word), upsert (default for ICS), add (default for JSON)"
+        ),
+    ] = None,
+    replace_from: Annotated[
+        str | None,
+        typer.Option(
+            "--replace-from",
+            help="Start date for ReplaceByRange (YYYY-MM-DD). Requires --replace-to."
+        ),
+    ] = None,
+    replace_to: Annotated[
+        str | None,
+        typer.Option(
+            "--replace-to",
+            help="End date for ReplaceByRange (YYYY-MM-DD). Requires --replace-from."
+        ),
+    ] = None,
+    template_name: Annotated[
+        str | None,
+        typer.Option(
+            "--template", "-t", help="Template name to use (overrides config)"
+        ),
+    ] = None,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force", "-f", help="Skip confirmation prompt and save directly"
+        ),
+    ] = False,
+) -> None:
+    """Ingest several calendar data files into one calendar in a single pass.
+
+    The events from all files are combined and merged into the calendar as
+    one source, so the template and existing calendar are loaded once and
+    data.json is written once. This differs from running 'ingest' once per
+    file: with replace-year or a --replace-from/--replace-to range, the
+    year or range ends up holding the events of every file, not just the
+    last one. With the upsert strategy, events repeated across files by UID
+    keep the version from the last file.
+
+    Files must share a source type unless --strategy, --year, or
+    --replace-from/--replace-to is given.
+
+    Note: This only saves the JSON file. Use 'export' to generate ICS,
+    and 'commit' to commit changes to git.
+    """
+    ctx = get_context()
+    config = ctx.config
+    repository = ctx.repository
+    renderer = SummaryRenderer()
+
+    # Validate date range options
+    if (replace_from is None) != (replace_to is None):
+        console.print("[red]Error: --replace-from and --replace-to must be used together[/red]")
+        sys.exit(1)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Load template once (fallback: CLI arg → calendar config → global config)
+    # ─────────────────────────────────────────────────────────────────────────
+    calendar_settings = repository.load_settings(calendar_name)
+    calendar_template = calendar_settings.template if calendar_settings else None
+    effective_template_name = template_name or calendar_template or config.default_template
+    template = get_template(effective_template_name, config.template_dir)
+    logger.info(f"Using template: {template.name} (version {template.version})")
+
+    if calendar_settings is None and not repository.calendar_exists(calendar_name):
+        logger.info(f"Creating new calendar: {calendar_name}")
+        repository.create_calendar(
+            calendar_id=calendar_name,
+            template=effective_template_name,
+        )
+
+    input_paths = [Path(f).expanduser() for f in calendar_data_files]
+    existing = repository.load_calendar(calendar_name)
+    is_new = existing is None
+
+    # Updates need one default strategy for the batch; reject mixed source
+    # types before any file is parsed
+    if not is_new:
+        suffixes = {path.suffix.lower() for path in input_paths}
+        explicit = strategy or year or replace_from
+        if len(suffixes) > 1 and not explicit:
+            console.print(
+                "[red]Error: Files have mixed source types. "
+                "Use --strategy to choose how to merge them.[/red]"
+            )
+            sys.exit(1)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Ingest all source files
+    # ─────────────────────────────────────────────────────────────────────────
+    ingestion_service = ctx.ingestion_service
+    ingestion_results = [
+        _ingest_file(ingestion_service, path, template) for path in input_paths
+    ]
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Determine merge strategy (once, for the whole batch)
+    # ─────────────────────────────────────────────────────────────────────────
+    all_events = [e for result in ingestion_results for e in result.raw.events]
+    merge_strategy: MergeStrategy | None = None
+    if not is_new:
+        merge_strategy = _resolve_strategy(
+            all_events,
+            input_paths[0].suffix,
+            year,
+            strategy,
+            replace_from,
+            replace_to,
+        )
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Output: Header and sources
+    # ─────────────────────────────────────────────────────────────────────────
+    action = "Bulk ingesting (new)" if is_new else "Bulk ingesting (update)"
+    renderer.render_header(action, calendar_name)
+
+    if merge_strategy:
+        strategy_desc = _describe_strategy(merge_strategy)
+        console.print(f"  Merge strategy: [cyan]{strategy_desc}[/cyan]")
+
+    for path, result in zip(input_paths, ingestion_results):
+        renderer.render_source_info(path, result.summary, template)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Process calendar: one merge for the whole batch
+    # ─────────────────────────────────────────────────────────────────────────
+    raw = _combine_ingestions(
+        [result.raw for result in ingestion_results], merge_strategy
+    )
+    manager = ctx.calendar_manager
+
+    try:
+        processing_result = manager.create_or_update(
+            calendar_name,
+            raw,
+            is_new,
+            template,
+            merge_strategy,
+            year,
+            existing=existing,
+        )
+    except InvalidYearError as e:
+        logger.error(f"Year validation error: {e}")
+        sys.exit(1)
+
+    renderer.render_processing_summary(processing_result.processing_summary)
+
+    _display_changes(existing, processing_result.calendar, force)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Confirmation and Save
+    # ─────────────────────────────────────────────────────────────────────────
+    json_path = _confirm_and_save_json(repository, processing_result.calendar, force)
+
+    file_msg = f"{len(input_paths)} file{'s' if len(input_paths) != 1 else ''}"
+    if is_new:
+        renderer.render_success(f"Calendar ingested from {file_msg} (new)", json_path)
+    else:
+        year_msg = f", year {processing_result.year}" if processing_result.year else ""
+        renderer.render_success(f"Calendar ingested from {file_msg}{year_msg}", json_path)
+
+    console.print(f"\n[bold]Next steps:[/bold]")
+    console.print(f"  • Run 'export {calendar_name}' to generate ICS")
+    console.print(f"  • Run 'commit {calendar_name}' to commit to git")
+
+
+def _display_changes(
+    existing: Calendar | None, updated: Calendar, force: bool
+) -> None:
+    """Show how the save will change the calendar.
+
+    The full diff is only computed when someone can review it before
+    confirming. With --force, or when output is not a terminal, a one-line
+    event count is shown instead.
+    """
+    if force or not console.is_terminal:
+        before = len(existing.events) if existing else 0
+        console.print(f"\nEvents: {before} → {len(updated.events)}")
+    elif existing is None:
+        display_diff(None, updated.events, "empty", "new", compact=True)
+    else:
+        display_diff(existing.events, updated.events, "previous", "updated")
+
+
+def _confirm_and_save_json(
+    repository: CalendarRepository, calendar: Calendar, force: bool
+) -> Path:
+    """Confirm with the user, then save the calendar's canonical JSON.
+
+    While the prompt is open the calendar is serialized on a worker thread,
+    so only the file write remains once the user confirms. The calendar is
+    stamped beforehand on this thread, so the saved last_updated time is
+    when the prompt opened. With --force there is no prompt to overlap with
+    and the calendar is saved directly.
+    """
+    if force:
+        return repository.save_json(calendar)
+
+    calendar.last_updated = datetime.now()
+    executor = ThreadPoolExecutor(max_workers=1)
+    content = executor.submit(calendar.to_json)
+    try:
+        confirm_or_exit("Save calendar JSON?")
+    finally:
+        executor.shutdown(wait=False)
+
+    return repository.write_json(calendar.name, content.result())
+
+
+def _ingest_file(
+    ingestion_service: IngestionService,
+    input_path: Path,
+    template: CalendarTemplate,
+) -> IngestionResult:
+    """Ingest a single source file, exiting with an error message on failure."""
+    try:
+        return ingestion_service.ingest(input_path, template)
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    except UnsupportedFormatError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    except IngestionError as e:
+        logger.error(f"Failed to read calendar file: {e}")
+        sys.exit(1)
+    except InvalidYearError as e:
+        logger.error(f"Year validation error: {e}")
+        sys.exit(1)
+
+
+def _resolve_strategy(
+    events: list[Event],
+    source_suffix: str,
+    year: int | None,
+    strategy: StrategyChoice | None,
+    replace_from: str | None,
+    replace_to: str | None,
+) -> MergeStrategy:
+    """Build the merge strategy for updating an existing calendar from CLI options.
+
+    Precedence: explicit date range, then --strategy, then --year, then the
+    default for the source file type. Exits with an error message if a year
+    is needed but cannot be inferred from the events.
+    """
+    if replace_from and replace_to:
+        # Explicit date range
+        return ReplaceByRange(
+            start_date=parse_date(replace_from),
+            end_date=parse_date(replace_to),
+        )
+    if strategy:
+        # Explicit strategy choice
+        if strategy == "replace-year":
+            if year is None:
+                # Try to infer from events
+                year = infer_year(events)
+                if year is None:
+                    console.print(
+                        "[red]Error: Cannot infer year from multi-year source. "
+                        "Use --year to specify.[/red]"
+                    )
+                    sys.exit(1)
+            return ReplaceByYear(year)
+        if strategy == "upsert":
+            return UpsertById()
+        return Add()
+    if year:
+        # Year specified without strategy - use ReplaceByYear
+        return ReplaceByYear(year)
+    # Use default strategy for source type
+    try:
+        return get_default_strategy_for_source(source_suffix, events, year)
+    except InvalidYearError as e:
+        logger.error(f"Year validation error: {e}")
+        sys.exit(1)
+
+
+def _combine_ingestions(
+    raws: list[RawIngestion], strategy: MergeStrategy | None
+) -> RawIngestion:
+    """Concatenate raw ingestions from several files into one batch.
+
+    For UpsertById, events sharing a UID are collapsed to the one from the
+    last file, so the merge sees each UID once. Events without a UID are
+    always kept. The batch's revision date is the latest of the inputs.
+
+    Args:
+        raws: Raw ingestions in file order
+        strategy: Merge strategy the batch will be applied with
+
+    Returns:
+        A single RawIngestion covering every file
+    """
+    events = [e for raw in raws for e in raw.events]
+
+    if isinstance(strategy, UpsertById):
+        by_uid: dict[str, Event] = {}
+        without_uid: list[Event] = []
+        for event in events:
+            if event.uid:
+                by_uid[event.uid] = event
+            else:
+                without_uid.append(event)
+        events = [*by_uid.values(), *without_uid]
+
+    revision_dates = [raw.revised_at for raw in raws if raw.revised_at]
+    return RawIngestion(
+        events=events,
+        revised_at=max(revision_dates) if revision_dates else None,
+    )
+
+
+# Human-readable description for each merge strategy type
+_STRATEGY_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    ReplaceByYear: lambda s: f"Replace year {s.year}",
+    ReplaceByRange: lambda s: f"Replace range {s.start_date} to {s.end_date}",
+    UpsertById: lambda _: "Upsert by ID",
+    Add: lambda _: "Add events",
+}
+
+
 def _describe_strategy(strategy: MergeStrategy) -> str:
     """Get a human-readable description of a merge strategy."""
-    match strategy:
-        case ReplaceByYear(year=y):
-            return f"Replace year {y}"
-        case ReplaceByRange(start_date=s, end_date=e):
-            return f"Replace range {s} to {e}"
-        case UpsertById():
-            return "Upsert by ID"
-        case Add():
-            return "Add events"
-    return str(strategy)
+    return _STRATEGY_FORMATTERS.get(type(strategy), str)(strategy)
 
 
 # Alias for CLI registration
 ingest = ingest_command
+bulk_ingest = bulk_ingest_command
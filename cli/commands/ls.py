@@ -60,42 +60,40 @@ def _list_calendars(
     repository, config, renderer: TableRenderer, include_archived: bool
 ) -> None:
     """List all calendars."""
-    calendars = repository.list_calendars(include_deleted=include_archived)
-    if not calendars:
-        renderer.render_empty("No calendars found")
-        return
-
-    # Count archived calendars
-    if not include_archived:
-        all_calendars = repository.list_calendars(include_deleted=True)
-        visible_calendars = repository.list_calendars(include_deleted=False)
-        archived_count = len(all_calendars) - len(visible_calendars)
-    else:
-        archived_count = 0
+    # List once including archived calendars; hidden ones are only counted
+    all_calendars = repository.list_calendars(include_deleted=True)
 
     # Collect calendar info
     calendar_info = []
-    for cal_id in calendars:
+    archived_count = 0
+    cwd = Path.cwd()
+    for cal_id in all_calendars:
         paths = repository.paths(cal_id)
-        archived = not paths.directory.exists()
+        # One stat of config.json decides visibility, archived state and display
+        has_settings = paths.exists
+        if not include_archived and not has_settings:
+            archived_count += 1
+            continue
+        archived = not has_settings and not paths.directory.exists()
 
         # Get config file path (relative to cwd for terminal links)
-        if paths.settings.exists():
+        if has_settings:
+            settings_path = paths.settings.resolve()
             try:
-                config_display = str(paths.settings.resolve().relative_to(Path.cwd()))
+                config_display = str(settings_path.relative_to(cwd))
             except ValueError:
-                config_display = str(paths.settings.resolve())
+                config_display = str(settings_path)
         else:
             config_display = "-"
 
-        # Get last updated from calendar
+        # Get last updated from calendar metadata (events aren't needed)
         last_updated = None
-        calendar = repository.load_calendar(cal_id)
-        if calendar:
-            last_updated = calendar.last_updated
+        summary = repository.load_calendar_summary(cal_id)
+        if summary:
+            last_updated = summary.last_updated
 
         # Get display name and created date from settings
-        settings = repository.load_settings(cal_id)
+        settings = repository.load_settings(cal_id) if has_settings else None
         display_name = settings.name if settings else None
         created = settings.created if settings else None
 
@@ -110,6 +108,10 @@ def _list_calendars(
             )
         )
 
+    if not calendar_info:
+        renderer.render_empty("No calendars found")
+        return
+
     renderer.render_calendar_list(calendar_info, config.calendar_dir, archived_count)
 
 
@@ -123,29 +125,25 @@ def _list_versions(
     limit: int | None,
 ) -> None:
     """List versions for a specific calendar."""
-    all_versions = repository.list_calendar_versions(name)
-    if not all_versions:
+    # Apply pagination in git itself so only the shown versions are read
+    if show_all:
+        limit = None
+    elif limit is None:
+        limit = config.ls_default_limit
+    versions_data = repository.list_calendar_versions(name, max_count=limit or None)
+    if not versions_data:
         renderer.render_empty(f"No versions found for calendar '{name}'")
         return
 
-    # Apply pagination
-    total_versions = len(all_versions)
-    truncated = False
-    if not show_all:
-        if limit is None:
-            limit = config.ls_default_limit
-        if limit and total_versions > limit:
-            versions_data = all_versions[:limit]
-            truncated = True
-        else:
-            versions_data = all_versions
-    else:
-        versions_data = all_versions
+    # A full page may hide older versions; only then is a count needed
+    total_versions = len(versions_data)
+    if limit and total_versions == limit:
+        total_versions = repository.count_calendar_versions(name)
+    truncated = total_versions > len(versions_data)
 
     # Get paths for this calendar
     paths = repository.paths(name)
     git_service = repository.git_service
-    repo_root = git_service.repo_root
 
     # Canonical path for version tracking (data.json is the source of truth)
     canonical_path = paths.data
@@ -154,12 +152,24 @@ def _list_versions(
     current_commit_hash = None
     try:
         if canonical_path.exists():
-            current_commit_hash = repository.git_service.get_current_commit_hash(
-                canonical_path
-            )
+            current_commit_hash = git_service.get_current_commit_hash(canonical_path)
     except Exception:
         pass
 
+    # Fetch every listed version's content in one git call for details
+    contents: dict[str, tuple[str, bytes]] = {}
+    if show_info:
+        try:
+            contents = git_service.get_files_at_commits(
+                canonical_path, [commit_hash for commit_hash, _, _ in versions_data]
+            )
+        except Exception:
+            pass
+
+    # Validation results per blob id; restored versions repeat an earlier
+    # file byte for byte and needn't be parsed again
+    details_by_blob: dict[str, tuple[int | None, bool]] = {}
+
     # Build version info objects
     versions = []
     for idx, (commit_hash, commit_date, commit_message) in enumerate(versions_data, 1):
@@ -168,23 +178,15 @@ def _list_versions(
         is_valid = None
 
         if show_info:
-            try:
-                # Get file content to calculate size and event count
-                calendar_content = git_service.get_file_at_commit(
-                    canonical_path, commit_hash
-                )
-                if calendar_content:
-                    file_size = len(calendar_content)
-                    # Validate using Calendar model and count events
-                    try:
-                        calendar = Calendar.model_validate_json(calendar_content)
-                        event_count = len(calendar.events)
-                        is_valid = True
-                    except Exception:
-                        is_valid = False
-
-            except Exception:
-                pass
+            # Use file content to calculate size and event count
+            blob_id, calendar_content = contents.get(commit_hash, (None, b""))
+            if calendar_content:
+                file_size = len(calendar_content)
+                details = details_by_blob.get(blob_id)
+                if details is None:
+                    details = _content_details(calendar_content)
+                    details_by_blob[blob_id] = details
+                event_count, is_valid = details
 
         versions.append(
             VersionInfo(
@@ -212,3 +214,12 @@ def _list_versions(
         truncated=truncated,
         data_path=data_path_display,
     )
+
+
+def _content_details(content: bytes) -> tuple[int | None, bool]:
+    """Validate calendar JSON content, returning (event_count, is_valid)."""
+    try:
+        calendar = Calendar.model_validate_json(content)
+    except Exception:
+        return None, False
+    return len(calendar.events), True
@@ -91,11 +91,8 @@ def restore(
                 break
 
     # Get commit info for confirmation
-    commit_info = None
-    for v_hash, v_date, v_message in versions:
-        if v_hash == target_commit:
-            commit_info = (v_hash, v_date, v_message)
-            break
+    version_by_hash = {version[0]: version for version in versions}
+    commit_info = version_by_hash.get(target_commit)
 
     if commit_info is None:
         logger.error(f"Commit '{commit}' not found for calendar '{name}'")
@@ -12,10 +12,9 @@ import typer
 from typing_extensions import Annotated
 
 from app.exceptions import IngestionError, InvalidYearError, UnsupportedFormatError
-from app.ingestion.service import IngestionService
 from app.models.ingestion import IngestionContext
 from app.models.template_loader import get_template
-from app.processing.calendar_manager import CalendarManager, get_default_strategy_for_source
+from app.processing.calendar_manager import get_default_strategy_for_source
 from cli.commands.diff import display_diff
 from cli.context import get_context
 from cli.display import SummaryRenderer, push_calendar
@@ -59,7 +58,6 @@ def sync_command(
     config = ctx.config
     repository = ctx.repository
     git_service = ctx.git_service
-    reader_registry = ctx.reader_registry
     renderer = SummaryRenderer()
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -88,8 +86,8 @@ def sync_command(
     # ─────────────────────────────────────────────────────────────────────────
     # Ingest source file
     # ─────────────────────────────────────────────────────────────────────────
-    input_path = Path(calendar_data_file).expanduser().resolve()
-    ingestion_service = IngestionService(reader_registry)
+    input_path = Path(calendar_data_file).expanduser()
+    ingestion_service = ctx.ingestion_service
 
     try:
         ingestion_result = ingestion_service.ingest(input_path, template)
@@ -150,7 +148,7 @@ def sync_command(
     # ─────────────────────────────────────────────────────────────────────────
     # Process calendar
     # ─────────────────────────────────────────────────────────────────────────
-    manager = CalendarManager(repository)
+    manager = ctx.calendar_manager
 
     try:
         processing_result = manager.create_or_update(
@@ -160,6 +158,7 @@ def sync_command(
             template,
             merge_strategy,
             year,
+            existing=ingestion_ctx.existing_calendar,
         )
     except InvalidYearError as e:
         logger.error(f"Year validation error: {e}")
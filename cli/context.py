@@ -1,8 +1,13 @@
 """Shared CLI context with lazy-initialized dependencies."""
 
+import os
+from functools import lru_cache
+
 from app import setup_reader_registry
 from app.config import CalendarConfig
 from app.ingestion.base import ReaderRegistry
+from app.ingestion.service import IngestionService
+from app.processing.calendar_manager import CalendarManager
 from app.storage.calendar_repository import CalendarRepository
 from app.storage.calendar_storage import CalendarStorage
 from app.storage.git_service import GitService
@@ -12,7 +17,8 @@ class CLIContext:
     """Shared context with lazy-initialized dependencies for CLI commands.
 
     This eliminates the need for each command to manually create config, storage,
-    reader_registry, git_service, and repository objects.
+    reader_registry, git_service, repository, ingestion_service, and
+    calendar_manager objects.
 
     Usage:
         ctx = CLIContext()
@@ -35,6 +41,8 @@ class CLIContext:
         self._reader_registry: ReaderRegistry | None = None
         self._git_service: GitService | None = None
         self._repository: CalendarRepository | None = None
+        self._ingestion_service: IngestionService | None = None
+        self._calendar_manager: CalendarManager | None = None
 
     @property
     def config(self) -> CalendarConfig:
@@ -85,6 +93,65 @@ class CLIContext:
             )
         return self._repository
 
+    @property
+    def ingestion_service(self) -> IngestionService:
+        """Get ingestion service for the reader registry (lazy-loaded)."""
+        if self._ingestion_service is None:
+            self._ingestion_service = IngestionService(self.reader_registry)
+        return self._ingestion_service
+
+    @property
+    def calendar_manager(self) -> CalendarManager:
+        """Get calendar manager for the repository (lazy-loaded)."""
+        if self._calendar_manager is None:
+            self._calendar_manager = CalendarManager(self.repository)
+        return self._calendar_manager
+
+
+# Environment variables read by CalendarConfig.from_env
+_CONFIG_ENV_VARS = (
+    "CALENDAR_DIR",
+    "TEMPLATE_DIR",
+    "LOG_DIR",
+    "LOG_FILENAME",
+    "DEFAULT_TEMPLATE",
+    "CALENDAR_GIT_REMOTE_URL",
+    "GIT_DEFAULT_REMOTE",
+    "GIT_DEFAULT_BRANCH",
+    "LS_DEFAULT_LIMIT",
+)
+
+
+def _env_signature() -> tuple[str | None, ...]:
+    """Snapshot of the process state that configuration is derived from."""
+    return (os.getcwd(), *(os.environ.get(var) for var in _CONFIG_ENV_VARS))
+
+
+@lru_cache(maxsize=4)
+def _cached_context(
+    verbose: bool, quiet: bool, env_signature: tuple[str | None, ...]
+) -> CLIContext:
+    """Build a context for the given flags and environment snapshot."""
+    return CLIContext(verbose=verbose, quiet=quiet)
+
+
+def get_shared_context(verbose: bool = False, quiet: bool = False) -> CLIContext:
+    """Get a CLI context, reusing one built earlier under the same environment.
+
+    Repeated command invocations in one process (e.g. tests or embedding the
+    Typer app) then share the already-loaded config, storage, git service and
+    repository. Changing the working directory or any configuration
+    environment variable yields a fresh context.
+
+    Args:
+        verbose: If True, enable debug logging
+        quiet: If True, suppress non-error output
+
+    Returns:
+        CLI context for the current environment
+    """
+    return _cached_context(verbose, quiet, _env_signature())
+
 
 # Global context instance (set by Typer callback)
 _ctx: CLIContext | None = None
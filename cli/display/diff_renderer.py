@@ -1,14 +1,9 @@
 """Diff renderer for calendar comparison display."""
 
-from datetime import time
-
 from app.models.calendar import Calendar
 from app.models.event import Event
 from cli.display.console import console
 
-# Used for sorting events without a start time (all-day events sort to beginning of day)
-_SORT_TIME_FALLBACK = time(0, 0)
-
 
 class DiffRenderer:
     """Render calendar diff output.
@@ -25,12 +20,16 @@ class DiffRenderer:
         Returns:
             Formatted string like "2026-01-17 08:00-12:00: Event Title".
         """
-        date_str = event.date.strftime("%Y-%m-%d")
+        # Format from integer fields directly; strftime is much slower per call
+        d = event.date
+        date_str = f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
         time_str = ""
-        if event.start:
-            time_str = f" {event.start.strftime('%H:%M')}"
-            if event.end:
-                time_str += f"-{event.end.strftime('%H:%M')}"
+        start = event.start
+        if start:
+            time_str = f" {start.hour:02d}:{start.minute:02d}"
+            end = event.end
+            if end:
+                time_str += f"-{end.hour:02d}:{end.minute:02d}"
         return f"{date_str}{time_str}: {event.title}"
 
     def render_diff(
@@ -45,6 +44,9 @@ class DiffRenderer:
     ) -> bool:
         """Render diff output between two calendar states.
 
+        Events are rendered in the order given; callers pass chronologically
+        sorted lists (as returned by the diff computation).
+
         Args:
             added: List of added events.
             removed: List of removed events.
@@ -132,10 +134,12 @@ class DiffRenderer:
         if not added:
             return
 
-        console.print("[bold green]Added events:[/bold green]")
-        for event in sorted(added, key=lambda e: (e.date, e.start or _SORT_TIME_FALLBACK)):
-            summary = self.format_event_summary(event)
-            console.print(f"[green]  + {summary}[/green]")
+        # Build the section up front and print it in one call
+        lines = ["[bold green]Added events:[/bold green]"]
+        lines.extend(
+            f"[green]  + {self.format_event_summary(event)}[/green]" for event in added
+        )
+        console.print("\n".join(lines))
         console.print()
 
     def _render_removed(self, removed: list[Event]) -> None:
@@ -143,10 +147,11 @@ class DiffRenderer:
         if not removed:
             return
 
-        console.print("[bold red]Removed events:[/bold red]")
-        for event in sorted(removed, key=lambda e: (e.date, e.start or _SORT_TIME_FALLBACK)):
-            summary = self.format_event_summary(event)
-            console.print(f"[red]  - {summary}[/red]")
+        lines = ["[bold red]Removed events:[/bold red]"]
+        lines.extend(
+            f"[red]  - {self.format_event_summary(event)}[/red]" for event in removed
+        )
+        console.print("\n".join(lines))
         console.print()
 
     def _render_modified(self, modified: list[tuple[Event, Event]]) -> None:
@@ -154,28 +159,22 @@ class DiffRenderer:
         if not modified:
             return
 
-        # Exclude computed fields from comparison
-        exclude = {"is_all_day", "is_overnight"}
-
-        console.print("[bold yellow]Modified events:[/bold yellow]")
-        for old_event, new_event in sorted(
-            modified, key=lambda x: (x[1].date, x[1].start or _SORT_TIME_FALLBACK)
-        ):
+        lines = ["[bold yellow]Modified events:[/bold yellow]"]
+        for old_event, new_event in modified:
             summary = self.format_event_summary(new_event)
-            console.print(f"[yellow]  ~ {summary}[/yellow]")
-
-            # Show what changed - compare all fields dynamically
-            old_dict = old_event.model_dump(exclude=exclude)
-            new_dict = new_event.model_dump(exclude=exclude)
+            lines.append(f"[yellow]  ~ {summary}[/yellow]")
 
-            for field in old_dict:
-                old_val = old_dict[field]
-                new_val = new_dict[field]
+            # Show what changed - compare stored fields (computed fields derive
+            # from these), reading attributes rather than dumping both models
+            for field in Event.model_fields:
+                old_val = getattr(old_event, field)
+                new_val = getattr(new_event, field)
                 if old_val != new_val:
                     # Format values for display
                     old_str = self._format_field_value(old_val)
                     new_str = self._format_field_value(new_val)
-                    console.print(f"      {field}: {old_str} → {new_str}")
+                    lines.append(f"      {field}: {old_str} → {new_str}")
+        console.print("\n".join(lines))
         console.print()
 
     def _format_field_value(self, value) -> str:
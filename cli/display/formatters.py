@@ -1,14 +1,17 @@
 """Pure formatting functions for display output."""
 
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 
-def format_relative_time(dt: datetime) -> str:
+def format_relative_time(dt: datetime, now: datetime | None = None) -> str:
     """Format datetime as relative time.
 
     Args:
         dt: Datetime to format.
+        now: Timezone-aware reference time. Pass one in when formatting
+            several datetimes so they are all measured from the same instant.
 
     Returns:
         Formatted time string (e.g., "2h ago", "1w ago", "3mo ago", "1y ago").
@@ -17,7 +20,8 @@ def format_relative_time(dt: datetime) -> str:
         # If no timezone, assume UTC
         dt = dt.replace(tzinfo=timezone.utc)
 
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     time_diff = now - dt
 
     if time_diff.days == 0:
@@ -65,12 +69,15 @@ def format_file_size(size_bytes: int) -> str:
 def format_datetime(
     dt: datetime | date | None,
     include_relative: bool = True,
+    now: datetime | None = None,
 ) -> str:
     """Format datetime or date with optional relative time.
 
     Args:
         dt: Datetime or date to format, or None.
         include_relative: Whether to include relative time suffix.
+        now: Timezone-aware reference time for the relative suffix
+            (defaults to the current time).
 
     Returns:
         Formatted datetime string, or "N/A" if dt is None.
@@ -80,20 +87,32 @@ def format_datetime(
 
     # Handle date objects (no time component)
     if isinstance(dt, date) and not isinstance(dt, datetime):
-        return dt.strftime("%Y-%m-%d")
+        return dt.isoformat()
 
-    # Handle datetime objects
-    # Ensure timezone-aware
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-
-    date_str = dt.strftime("%Y-%m-%d %H:%M:%S")
+    # Handle datetime objects: the absolute part is the wall-clock time in
+    # dt's own zone. format_relative_time treats naive datetimes as UTC itself
+    wall_clock = dt if dt.tzinfo is None else dt.replace(tzinfo=None)
+    date_str = _format_timestamp(wall_clock)
     if include_relative:
-        relative = format_relative_time(dt)
+        relative = format_relative_time(dt, now)
         return f"{date_str} ({relative})"
     return date_str
 
 
+@lru_cache(maxsize=64)
+def _format_timestamp(dt: datetime) -> str:
+    """Format a naive datetime's absolute part, memoized per value.
+
+    The same timestamps recur within a command (e.g. created and last
+    updated), so repeat calls skip formatting. Relative times depend on the
+    current time and are never cached. Only naive values are passed in:
+    aware datetimes in different zones compare equal for the same instant,
+    so they would share a cache entry despite different wall-clock times.
+    """
+    # Same output as strftime("%Y-%m-%d %H:%M:%S") without parsing a format
+    return dt.isoformat(sep=" ", timespec="seconds")
+
+
 def format_path(path: Path | str) -> str:
     """Format a path as relative to the current working directory.
 
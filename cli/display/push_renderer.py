@@ -6,7 +6,7 @@ import typer
 
 from app.exceptions import GitCommandError, GitError
 from app.storage.git_service import GitService
-from app.storage.subscription_url_generator import SubscriptionUrlGenerator
+from app.storage.subscription_url_generator import get_subscription_url_generator
 from cli.display.console import console
 
 
@@ -147,8 +147,10 @@ def push_calendar(
 
         # Subscription URLs
         if remote_url:
-            url_generator = SubscriptionUrlGenerator(
-                git_service.repo_root, git_service.remote_url
+            # remote_url is already resolved (config override, else git), so
+            # the generator needn't query git for it again
+            url_generator = get_subscription_url_generator(
+                git_service.repo_root, remote_url
             )
             urls = url_generator.generate_subscription_urls(
                 calendar_name, calendar_path, "ics"
@@ -4,10 +4,16 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from rich.console import Group, RenderableType
 from rich.table import Table
 
 from cli.display.console import console
-from cli.display.formatters import format_file_size, format_path, format_relative_time
+from cli.display.formatters import (
+    format_datetime,
+    format_file_size,
+    format_path,
+    format_relative_time,
+)
 
 
 @dataclass
@@ -70,6 +76,8 @@ class TableRenderer:
         table.add_column("UPDATED", style="dim")
         table.add_column("CONFIG", no_wrap=True)
 
+        # Measure every row's relative time from the same instant
+        now = datetime.now(timezone.utc)
         for cal in calendars:
             id_display = cal.id
             if cal.archived:
@@ -79,11 +87,11 @@ class TableRenderer:
             name_display = cal.name or "-"
 
             # Created date from config.json
-            created_str = cal.created.strftime("%Y-%m-%d") if cal.created else "-"
+            created_str = cal.created.date().isoformat() if cal.created else "-"
 
             # Last updated (relative time) from metadata
             updated_str = (
-                format_relative_time(cal.last_updated) if cal.last_updated else "-"
+                format_relative_time(cal.last_updated, now) if cal.last_updated else "-"
             )
 
             table.add_row(
@@ -120,10 +128,10 @@ class TableRenderer:
             return
 
         path_suffix = f" ({data_path})" if data_path else ""
-        console.print(
-            f"Versions for calendar '{calendar_name}'{path_suffix} ({total_versions} total):"
-        )
-        console.print()
+        output: list[RenderableType] = [
+            f"Versions for calendar '{calendar_name}'{path_suffix} ({total_versions} total):",
+            "",
+        ]
 
         table = Table(show_header=True, header_style="bold", box=None, padding=(0, 2))
         table.add_column("#", justify="right", style="dim")
@@ -138,15 +146,14 @@ class TableRenderer:
 
         table.add_column("")  # Current marker column (unlabeled)
 
+        # Measure every row's relative time from the same instant
+        now = datetime.now(timezone.utc)
         for ver in versions:
             short_hash = ver.commit_hash[:7]
 
-            # Format date/time
-            commit_date = ver.commit_date
-            if commit_date.tzinfo is None:
-                commit_date = commit_date.replace(tzinfo=timezone.utc)
-            date_str = commit_date.strftime("%Y-%m-%d %H:%M:%S")
-            relative_str = format_relative_time(commit_date)
+            # Format date/time (naive dates are treated as UTC for the relative part)
+            date_str = format_datetime(ver.commit_date, include_relative=False)
+            relative_str = format_relative_time(ver.commit_date, now)
 
             # Current marker
             current_marker = "[green]← current[/green]" if ver.is_current else ""
@@ -182,14 +189,17 @@ class TableRenderer:
                     current_marker,
                 )
 
-        console.print(table)
+        output.append(table)
 
         if truncated:
-            console.print()
-            console.print(
+            output.append("")
+            output.append(
                 f"[dim]... (showing {len(versions)} of {total_versions} versions, use --all to see all)[/dim]"
             )
 
+        # Emit header, table and footer in a single write
+        console.print(Group(*output))
+
     def render_empty(self, message: str) -> None:
         """Render an empty state message.
 
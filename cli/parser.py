@@ -4,7 +4,7 @@ import typer
 from typing_extensions import Annotated
 
 from cli import setup_logging
-from cli.context import CLIContext, set_context
+from cli.context import get_shared_context, set_context
 
 # Create the main Typer app
 app = typer.Typer(
@@ -17,6 +17,9 @@ app = typer.Typer(
 # Version from pyproject.toml
 __version__ = "0.1.0"
 
+# Read-only commands that don't need a persistent log file
+READ_ONLY_COMMANDS = frozenset({"config", "ls", "show", "info", "diff"})
+
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
@@ -27,6 +30,7 @@ def version_callback(value: bool) -> None:
 
 @app.callback()
 def main_callback(
+    ctx: typer.Context,
     verbose: Annotated[
         bool,
         typer.Option("--verbose", "-v", help="Show debug output"),
@@ -47,21 +51,24 @@ def main_callback(
 ) -> None:
     """Calendar sync tool with simplified sync command."""
     # Set up logging based on flags
-    setup_logging(verbose=verbose, quiet=quiet)
+    setup_logging(
+        verbose=verbose,
+        quiet=quiet,
+        persist_logs=ctx.invoked_subcommand not in READ_ONLY_COMMANDS,
+    )
 
-    # Create and set global context
-    ctx = CLIContext(verbose=verbose, quiet=quiet)
-    set_context(ctx)
+    # Set global context (reused across invocations in the same environment)
+    set_context(get_shared_context(verbose=verbose, quiet=quiet))
 
 
 from cli.commands.commit import commit
 from cli.commands.config import config
 from cli.commands.delete import delete, rm
 from cli.commands.diff import diff
-from cli.commands.export import export
+from cli.commands.export import export, export_all
 from cli.commands.git_setup import git_setup
 from cli.commands.info import info
-from cli.commands.ingest import ingest
+from cli.commands.ingest import bulk_ingest, ingest
 from cli.commands.ls import ls
 from cli.commands.mv import mv
 from cli.commands.new import new
@@ -77,7 +84,9 @@ from cli.commands.template import template
 
 app.command(name="sync")(sync)
 app.command(name="ingest")(ingest)
+app.command(name="bulk-ingest")(bulk_ingest)
 app.command(name="export")(export)
+app.command(name="export-all")(export_all)
 app.command(name="commit")(commit)
 app.command(name="ls")(ls)
 app.command(name="show")(show)
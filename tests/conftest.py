@@ -1,10 +1,33 @@
+import logging
+from pathlib import Path
+
 import pytest
 
 from app import create_app
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
 
 @pytest.fixture
 def app():
     """Create and configure a Flask app for testing."""
     app = create_app()
     return app
+
+
+@pytest.fixture
+def cli_env(tmp_path, monkeypatch):
+    """Point the CLI at a temporary calendar directory for one test."""
+    monkeypatch.setenv("CALENDAR_DIR", str(tmp_path / "calendars"))
+    monkeypatch.setenv("TEMPLATE_DIR", str(REPO_ROOT / "data" / "templates"))
+    monkeypatch.setenv("LOG_DIR", str(tmp_path / "logs"))
+    monkeypatch.setenv("DEFAULT_TEMPLATE", "default")
+
+    # The CLI replaces the root logger's handlers; put them back afterwards
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    yield tmp_path
+    for handler in root_logger.handlers:
+        if handler not in handlers:
+            handler.close()
+    root_logger.handlers[:] = handlers
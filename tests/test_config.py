@@ -61,3 +61,17 @@ def test_calendar_config_invalid_ls_default_limit(monkeypatch):
     config = CalendarConfig.from_env()
     # Should fall back to default
     assert config.ls_default_limit == 5
+
+
+def test_shared_context_reused_until_env_changes(monkeypatch, tmp_path):
+    """Test CLI contexts are shared per environment and rebuilt on change."""
+    from cli.context import get_shared_context
+
+    monkeypatch.setenv("CALENDAR_DIR", str(tmp_path / "first"))
+    ctx = get_shared_context()
+    assert get_shared_context() is ctx
+    assert get_shared_context(verbose=True) is not ctx
+
+    monkeypatch.setenv("CALENDAR_DIR", str(tmp_path / "second"))
+    assert get_shared_context() is not ctx
+    assert get_shared_context().config.calendar_dir == tmp_path / "second"
@@ -0,0 +1,122 @@
+"""Tests for calendar diff computation."""
+
+from datetime import date, time
+
+import pytest
+import typer
+
+from app.models.event import Event
+from cli.commands.diff import _compute_diff, _events_differ, _resolve_version
+
+VERSIONS = [
+    ("c" * 40, None, "latest"),
+    ("b" * 40, None, "previous"),
+    ("a" * 40, None, "first"),
+    ("ab" + "0" * 38, None, "branch"),
+]
+
+
+def test_events_differ_ignores_identical_events():
+    """Identical events should not be reported as different."""
+    old = Event(title="Clinic", date=date(2025, 1, 6), start=time(8, 0), end=time(12, 0))
+    new = Event(title="Clinic", date=date(2025, 1, 6), start=time(8, 0), end=time(12, 0))
+    assert _events_differ(old, new) is False
+
+
+def test_events_differ_detects_non_key_field_change():
+    """A change to a field outside the diff key (e.g. location) is a difference."""
+    old = Event(title="Clinic", date=date(2025, 1, 6), location="Room 1")
+    new = Event(title="Clinic", date=date(2025, 1, 6), location="Room 2")
+    assert _events_differ(old, new) is True
+
+
+def test_compute_diff_added_removed_modified():
+    """Diff classifies added, removed, and modified events."""
+    kept = Event(title="Kept", date=date(2025, 1, 1))
+    moved_old = Event(title="Moved", date=date(2025, 1, 2), start=time(8, 0))
+    moved_new = Event(title="Moved", date=date(2025, 1, 2), start=time(9, 0))
+    gone = Event(title="Gone", date=date(2025, 1, 3))
+    fresh = Event(title="Fresh", date=date(2025, 1, 4))
+
+    added, removed, modified = _compute_diff(
+        [kept, moved_old, gone], [kept, moved_new, fresh]
+    )
+
+    assert added == [fresh]
+    assert removed == [gone]
+    assert modified == [(moved_old, moved_new)]
+
+
+def test_compute_diff_exact_match_with_changed_type_is_modified():
+    """Events sharing date/title/times but differing in type are modified."""
+    old = Event(title="Shift", date=date(2025, 2, 1), type="day")
+    new = Event(title="Shift", date=date(2025, 2, 1), type="night")
+
+    added, removed, modified = _compute_diff([old], [new])
+
+    assert added == []
+    assert removed == []
+    assert modified == [(old, new)]
+
+
+def test_compute_diff_pairs_duplicate_titles_in_file_order():
+    """Same-day events with one title pair up in file order, not by time."""
+    old_late = Event(title="Shift", date=date(2025, 4, 1), start=time(14, 0))
+    old_early = Event(title="Shift", date=date(2025, 4, 1), start=time(8, 0))
+    new_early = Event(title="Shift", date=date(2025, 4, 1), start=time(9, 0))
+    new_late = Event(title="Shift", date=date(2025, 4, 1), start=time(15, 0))
+
+    added, removed, modified = _compute_diff(
+        [old_late, old_early], [new_early, new_late]
+    )
+
+    assert added == []
+    assert removed == []
+    assert modified == [(old_late, new_early), (old_early, new_late)]
+
+
+def test_compute_diff_results_are_chronological():
+    """Each result list is sorted by date and start time."""
+    later = Event(title="B", date=date(2025, 5, 2))
+    earlier = Event(title="A", date=date(2025, 5, 1), start=time(9, 0))
+    all_day = Event(title="C", date=date(2025, 5, 1))
+
+    added, removed, _ = _compute_diff([later, earlier, all_day], [])
+    assert removed == [all_day, earlier, later]
+
+    added, _, _ = _compute_diff([], [later, earlier, all_day])
+    assert added == [all_day, earlier, later]
+
+
+def test_compute_diff_handles_none():
+    """None on either side is treated as an empty calendar."""
+    event = Event(title="Only", date=date(2025, 3, 1))
+
+    assert _compute_diff(None, [event]) == ([event], [], [])
+    assert _compute_diff([event], None) == ([], [event], [])
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("working", (None, "working")),
+        ("Local", (None, "working")),
+        ("HEAD", ("c" * 40, "HEAD (ccccccc)")),
+        ("latest", ("c" * 40, "latest (ccccccc)")),
+        ("previous", ("b" * 40, "previous (bbbbbbb)")),
+        ("#3", ("a" * 40, "#3 (aaaaaaa)")),
+        ("2", ("b" * 40, "#2 (bbbbbbb)")),
+        ("aaaa", ("a" * 40, "aaaaaaa")),
+        ("ab", ("ab" + "0" * 38, "ab00000")),
+    ],
+)
+def test_resolve_version(spec, expected):
+    """Version specifiers resolve to the expected commit and display name."""
+    assert _resolve_version(spec, VERSIONS) == expected
+
+
+@pytest.mark.parametrize("spec", ["#5", "#x", "ffff", "a", "2\n"])
+def test_resolve_version_not_found(spec):
+    """Unknown, ambiguous, or out-of-range specifiers raise BadParameter."""
+    with pytest.raises(typer.BadParameter):
+        _resolve_version(spec, VERSIONS)
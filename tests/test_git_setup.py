@@ -1,6 +1,5 @@
 """Tests for git-setup command."""
 
-import json
 import os
 import shutil
 import subprocess
@@ -48,43 +47,41 @@ def mock_context():
 
 def test_check_gh_cli_available():
     """Test checking if GitHub CLI is available."""
-    with patch("subprocess.run") as mock_run:
-        # Test when gh is available and authenticated
-        mock_run.side_effect = [
-            MagicMock(returncode=0),  # gh --version
-            MagicMock(returncode=0),  # gh auth status
-        ]
+    with patch("shutil.which") as mock_which:
+        # Test when gh is on PATH
+        git_setup_module._check_gh_cli_available.cache_clear()
+        mock_which.return_value = "/usr/bin/gh"
+        assert git_setup_module._check_gh_cli_available() is True
+
+        # Result is cached; PATH is not searched again
         assert git_setup_module._check_gh_cli_available() is True
+        assert mock_which.call_count == 1
 
         # Test when gh is not installed
-        mock_run.side_effect = [
-            MagicMock(returncode=1),  # gh --version fails
-        ]
+        git_setup_module._check_gh_cli_available.cache_clear()
+        mock_which.return_value = None
         assert git_setup_module._check_gh_cli_available() is False
 
-        # Test when gh is installed but not authenticated
-        mock_run.side_effect = [
-            MagicMock(returncode=0),  # gh --version
-            MagicMock(returncode=1),  # gh auth status fails
-        ]
-        assert git_setup_module._check_gh_cli_available() is False
+    git_setup_module._check_gh_cli_available.cache_clear()
 
 
 def test_get_github_username_from_gh():
     """Test getting GitHub username from gh CLI."""
     with patch("subprocess.run") as mock_run:
-        mock_data = {"login": "testuser"}
-        mock_run.return_value = MagicMock(
-            returncode=0, stdout=json.dumps(mock_data)
-        )
+        git_setup_module._get_github_username_from_gh.cache_clear()
+        mock_run.return_value = MagicMock(returncode=0, stdout="testuser\n")
         username = git_setup_module._get_github_username_from_gh()
         assert username == "testuser"
+        assert mock_run.call_args[0][0] == ["gh", "api", "user", "-q", ".login"]
 
         # Test when gh command fails
-        mock_run.return_value = MagicMock(returncode=1)
+        git_setup_module._get_github_username_from_gh.cache_clear()
+        mock_run.side_effect = subprocess.CalledProcessError(1, ["gh"])
         username = git_setup_module._get_github_username_from_gh()
         assert username is None
 
+    git_setup_module._get_github_username_from_gh.cache_clear()
+
 
 def test_create_repo_with_gh(tmp_path):
     """Test creating repo with GitHub CLI."""
@@ -244,3 +241,115 @@ def test_git_setup_creates_initial_commit(tmp_path, monkeypatch, mock_context):
             assert (calendar_dir / ".git").exists()
     finally:
         os.chdir(original_cwd)
+
+
+def test_remove_from_env_file_keeps_other_lines(tmp_path, monkeypatch):
+    """Test removing a key leaves comments and other keys untouched."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("# comment\nREMOVE_KEY=a\nKEEP_KEY=b=c\nREMOVE_KEY=d\n")
+
+    monkeypatch.chdir(tmp_path)
+    git_setup_module._remove_from_env_file("REMOVE_KEY")
+
+    assert env_file.read_text() == "# comment\nKEEP_KEY=b=c\n"
+    assert list(tmp_path.iterdir()) == [env_file]
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("git@github.com:owner/repo.git", "owner/repo"),
+        ("https://github.com/owner/repo.git", "owner/repo"),
+        ("http://github.com/owner/repo", "owner/repo"),
+        ("https://github.com/owner/my-digit/", "owner/my-digit"),
+        ("git@github.com:owner/dotnet.git", "owner/dotnet"),
+        ("https://github.com/owner", None),
+        ("https://gitlab.com/owner/repo.git", None),
+    ],
+)
+def test_extract_repo_name_from_url(url, expected):
+    """Test extracting owner/repo from GitHub remote URLs."""
+    assert git_setup_module._extract_repo_name_from_url(url) == expected
+
+
+def test_write_to_env_file_appends_without_rewriting(tmp_path, monkeypatch):
+    """Test a new key is appended to the existing file rather than rewriting it."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("# comment\nEXISTING_KEY=value")  # no trailing newline
+    inode = env_file.stat().st_ino
+
+    monkeypatch.chdir(tmp_path)
+    git_setup_module._write_to_env_file("NEW_KEY", "new_value")
+
+    assert env_file.read_text() == "# comment\nEXISTING_KEY=value\nNEW_KEY=new_value\n"
+    assert env_file.stat().st_ino == inode
+
+
+def test_probe_gh():
+    """Test gh probe returns the username only when gh is available."""
+    with patch.object(git_setup_module, "_get_github_username_from_gh", return_value="testuser"):
+        with patch.object(git_setup_module, "_check_gh_cli_available", return_value=True):
+            assert git_setup_module._probe_gh() == "testuser"
+        with patch.object(git_setup_module, "_check_gh_cli_available", return_value=False):
+            assert git_setup_module._probe_gh() is None
+
+
+def test_delete_git_repository(tmp_path, mock_context):
+    """Test --delete removes the local repo and the remote via gh."""
+    calendar_dir = tmp_path / "calendars"
+    calendar_dir.mkdir()
+    subprocess.run(["git", "init"], cwd=calendar_dir, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "remote", "add", "origin", "https://github.com/user/repo.git"],
+        cwd=calendar_dir,
+        check=True,
+        capture_output=True,
+    )
+
+    config = CalendarConfig()
+    config.calendar_dir = calendar_dir
+    mock_context._config = config
+
+    original_cwd = os.getcwd()
+    try:
+        os.chdir(tmp_path)
+        with patch.object(git_setup_module, "get_context", return_value=mock_context), \
+             patch.object(git_setup_module, "_check_gh_cli_available", return_value=True), \
+             patch.object(git_setup_module, "_delete_remote_repo", return_value=(True, "")) as mock_delete, \
+             patch.object(git_setup_module, "_is_interactive", return_value=True), \
+             patch("typer.confirm", return_value=True):
+            git_setup_func(delete=True)
+
+        mock_delete.assert_called_once_with("user/repo")
+        assert not (calendar_dir / ".git").exists()
+    finally:
+        os.chdir(original_cwd)
+
+
+def test_delete_git_repository_non_interactive(tmp_path, mock_context):
+    """Test --delete without a terminal cancels instead of prompting."""
+    calendar_dir = tmp_path / "calendars"
+    calendar_dir.mkdir()
+    subprocess.run(["git", "init"], cwd=calendar_dir, check=True, capture_output=True)
+
+    config = CalendarConfig()
+    config.calendar_dir = calendar_dir
+    mock_context._config = config
+
+    with patch.object(git_setup_module, "get_context", return_value=mock_context), \
+         patch.object(git_setup_module, "_is_interactive", return_value=False), \
+         patch("typer.confirm") as mock_confirm:
+        git_setup_func(delete=True)
+
+    mock_confirm.assert_not_called()
+    assert (calendar_dir / ".git").exists()
+
+
+def test_is_interactive(monkeypatch):
+    """Test prompts are disabled in CI even when stdin is a terminal."""
+    monkeypatch.setattr("sys.stdin.isatty", lambda: True)
+    monkeypatch.delenv("CI", raising=False)
+    assert git_setup_module._is_interactive() is True
+
+    monkeypatch.setenv("CI", "true")
+    assert git_setup_module._is_interactive() is False
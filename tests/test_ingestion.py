@@ -1,9 +1,11 @@
 """Tests for ingestion layer."""
 
+import json
 from datetime import date
 from pathlib import Path
 
 import pytest
+from typer.testing import CliRunner
 
 from app.exceptions import IngestionError, InvalidYearError, UnsupportedFormatError
 from app.ingestion.base import ReaderRegistry
@@ -14,6 +16,7 @@ from app.models.event import Event
 from app.models.ingestion import RawIngestion
 from app.models.template import CalendarTemplate, EventTypeConfig, TemplateDefaults
 from app.processing.merge_strategies import infer_year
+from cli.parser import app
 
 
 def test_reader_registry():
@@ -461,3 +464,85 @@ def test_parse_cell_events_multiple_periods():
     assert len(events) == 2
     assert events[0]["start"] == "0730"
     assert events[1]["start"] == "1230"
+
+
+def _write_json_source(path: Path, *events: tuple[str, str]) -> Path:
+    """Write a JSON source file with one 0900-1000 event per (title, date)."""
+    data = {
+        "events": [
+            {"title": title, "date": day, "start": "0900", "end": "1000"}
+            for title, day in events
+        ]
+    }
+    path.write_text(json.dumps(data))
+    return path
+
+
+def _saved_titles(cli_env: Path, name: str) -> list[str]:
+    """Titles of the events saved to a calendar's data.json, sorted."""
+    data = json.loads((cli_env / "calendars" / name / "data.json").read_text())
+    return sorted(event["title"] for event in data["events"])
+
+
+def test_bulk_ingest_creates_calendar_from_files(cli_env):
+    """bulk-ingest combines every file's events into a new calendar."""
+    first = _write_json_source(cli_env / "a.json", ("Alpha", "2025-01-01"))
+    second = _write_json_source(cli_env / "b.json", ("Beta", "2025-01-02"))
+
+    result = CliRunner().invoke(
+        app, ["bulk-ingest", "work", str(first), str(second), "--force"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "from 2 files (new)" in result.output
+    assert _saved_titles(cli_env, "work") == ["Alpha", "Beta"]
+
+
+def test_bulk_ingest_updates_existing_calendar(cli_env):
+    """bulk-ingest merges every file into an existing calendar at once."""
+    runner = CliRunner()
+    base = _write_json_source(cli_env / "base.json", ("Alpha", "2025-01-01"))
+    assert runner.invoke(app, ["ingest", "work", str(base), "--force"]).exit_code == 0
+
+    first = _write_json_source(cli_env / "a.json", ("Beta", "2025-01-02"))
+    second = _write_json_source(cli_env / "b.json", ("Gamma", "2025-01-03"))
+    result = runner.invoke(
+        app, ["bulk-ingest", "work", str(first), str(second), "--force"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Bulk ingesting (update)" in result.output
+    assert _saved_titles(cli_env, "work") == ["Alpha", "Beta", "Gamma"]
+
+
+def test_bulk_ingest_rejects_mixed_source_types(cli_env):
+    """Updating from mixed source types needs an explicit strategy."""
+    runner = CliRunner()
+    base = _write_json_source(cli_env / "base.json", ("Alpha", "2025-01-01"))
+    assert runner.invoke(app, ["ingest", "work", str(base), "--force"]).exit_code == 0
+
+    source = _write_json_source(cli_env / "a.json", ("Beta", "2025-01-02"))
+    # Not a valid ICS file; the check must fail before any file is parsed
+    (cli_env / "b.ics").write_text("not a calendar")
+    result = runner.invoke(
+        app,
+        ["bulk-ingest", "work", str(source), str(cli_env / "b.ics"), "--force"],
+    )
+
+    assert result.exit_code == 1
+    assert "mixed source types" in result.output
+    assert _saved_titles(cli_env, "work") == ["Alpha"]
+
+
+def test_bulk_ingest_requires_complete_date_range(cli_env):
+    """--replace-from without --replace-to is rejected."""
+    source = _write_json_source(cli_env / "a.json", ("Alpha", "2025-01-01"))
+
+    result = CliRunner().invoke(
+        app,
+        ["bulk-ingest", "work", str(source), "--replace-from", "2025-01-01", "--force"],
+    )
+
+    assert result.exit_code == 1
+    assert "must be used together" in result.output
+    assert not (cli_env / "calendars" / "work").exists()
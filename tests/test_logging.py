@@ -0,0 +1,90 @@
+"""Tests for CLI logging setup."""
+
+import io
+import logging
+
+import pytest
+from typer.testing import CliRunner
+
+from app.config import CalendarConfig
+from cli import setup_logging
+from cli.parser import READ_ONLY_COMMANDS, app
+
+
+@pytest.fixture
+def root_logger():
+    """Root logger whose handlers are restored after the test."""
+    logger = logging.getLogger()
+    handlers = logger.handlers[:]
+    yield logger
+    for handler in logger.handlers:
+        if handler not in handlers:
+            handler.close()
+    logger.handlers[:] = handlers
+
+
+def _file_handlers(logger: logging.Logger) -> list[logging.FileHandler]:
+    """File handlers installed on a logger."""
+    return [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+
+
+def test_setup_logging_repeat_call_keeps_handlers(root_logger, tmp_path):
+    """Test a repeat call with the same settings changes nothing."""
+    config = CalendarConfig(log_dir=tmp_path)
+    setup_logging(verbose=True, config=config)
+    handlers = root_logger.handlers[:]
+
+    setup_logging(verbose=True, config=config)
+
+    assert len(handlers) == 2
+    assert all(a is b for a, b in zip(root_logger.handlers, handlers))
+    assert _file_handlers(root_logger)[0].stream is not None
+
+
+def test_setup_logging_new_log_path_closes_old_file(root_logger, tmp_path):
+    """Test changed settings replace handlers and close the old log file."""
+    setup_logging(config=CalendarConfig(log_dir=tmp_path / "first"))
+    [old_file_handler] = _file_handlers(root_logger)
+
+    setup_logging(config=CalendarConfig(log_dir=tmp_path / "second"))
+
+    assert len(root_logger.handlers) == 2
+    assert old_file_handler not in root_logger.handlers
+    assert old_file_handler.stream is None  # closed
+    [new_file_handler] = _file_handlers(root_logger)
+    assert new_file_handler.baseFilename == str(
+        tmp_path / "second" / "calendar_sync.log"
+    )
+
+
+def test_setup_logging_new_stderr_replaces_handlers(
+    root_logger, tmp_path, monkeypatch
+):
+    """Test a swapped stderr stream (as under CliRunner) reinstalls handlers."""
+    config = CalendarConfig(log_dir=tmp_path)
+    setup_logging(config=config)
+    [old_file_handler] = _file_handlers(root_logger)
+
+    stderr = io.StringIO()
+    monkeypatch.setattr("sys.stderr", stderr)
+    setup_logging(config=config)
+
+    assert len(root_logger.handlers) == 2
+    assert old_file_handler.stream is None
+    logging.getLogger("test").warning("to the new stream")
+    assert "WARNING: to the new stream" in stderr.getvalue()
+
+
+def test_read_only_commands_do_not_create_log_file(cli_env):
+    """Read-only commands log to the console only; writes keep a log file."""
+    runner = CliRunner()
+    log_file = cli_env / "logs" / "calendar_sync.log"
+    assert {"ls", "info", "diff"} <= READ_ONLY_COMMANDS
+
+    for args in (["ls"], ["config"], ["info", "missing"], ["diff", "missing"]):
+        runner.invoke(app, args)
+        assert not log_file.exists(), args
+
+    result = runner.invoke(app, ["new", "work"])
+    assert result.exit_code == 0, result.output
+    assert log_file.exists()
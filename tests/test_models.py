@@ -1,10 +1,11 @@
 """Tests for Pydantic models."""
 
+import json
 from datetime import date, datetime, time
 
 import pytest
 
-from app.models.calendar import Calendar
+from app.models.calendar import Calendar, CalendarSummary
 from app.models.event import Event
 from app.processing.merge_strategies import infer_year
 
@@ -134,3 +135,87 @@ def test_calendar_metadata_fields():
     assert calendar.source_revised_at == date(2025, 1, 15)
     assert calendar.template_name == "default"
     assert calendar.template_version == "1.0"
+
+
+def test_calendar_date_range():
+    """Test date_range finds the extremes of unordered events."""
+    now = datetime.now()
+    events = [
+        Event(title="Middle", date=date(2025, 3, 1)),
+        Event(title="Last", date=date(2025, 6, 1)),
+        Event(title="First", date=date(2025, 1, 1)),
+    ]
+
+    calendar = Calendar(events=events, name="test_calendar", created=now, last_updated=now)
+    assert calendar.date_range() == (date(2025, 1, 1), date(2025, 6, 1))
+
+    empty = Calendar(events=[], name="empty", created=now, last_updated=now)
+    assert empty.date_range() is None
+
+
+def test_calendar_save_stores_date_range(tmp_path):
+    """Test save persists the event date range and load ignores it."""
+    now = datetime.now()
+    events = [
+        Event(title="Last", date=date(2025, 6, 1)),
+        Event(title="First", date=date(2025, 1, 1)),
+    ]
+    calendar = Calendar(events=events, name="test_calendar", created=now, last_updated=now)
+
+    path = tmp_path / "data.json"
+    calendar.save(path)
+
+    data = json.loads(path.read_text())
+    assert data["min_date"] == "2025-01-01"
+    assert data["max_date"] == "2025-06-01"
+    assert Calendar.load(path) == calendar
+
+
+def test_calendar_summary_load(tmp_path):
+    """Test CalendarSummary reads metadata and event statistics."""
+    now = datetime.now()
+    events = [
+        Event(title="Last", date=date(2025, 6, 1)),
+        Event(title="First", date=date(2025, 1, 1)),
+    ]
+    calendar = Calendar(
+        events=events, name="test_calendar", created=now, last_updated=now, template_name="default"
+    )
+    path = tmp_path / "data.json"
+    calendar.save(path)
+
+    summary = CalendarSummary.load(path)
+    assert summary.name == "test_calendar"
+    assert summary.template_name == "default"
+    assert summary.event_count == 2
+    assert summary.date_range() == (date(2025, 1, 1), date(2025, 6, 1))
+
+    # Files saved before the date range was stored fall back to the raw events
+    data = json.loads(path.read_text())
+    del data["min_date"], data["max_date"]
+    path.write_text(json.dumps(data))
+    assert CalendarSummary.load(path).date_range() == (date(2025, 1, 1), date(2025, 6, 1))
+
+
+def test_calendar_to_json_layout_is_stable():
+    """Test canonical JSON keeps its layout, including ASCII escapes.
+
+    data.json is tracked in git, so any change to these bytes shows up as a
+    new version of every calendar.
+    """
+    calendar = Calendar(
+        events=[
+            Event(title="New Year’s Day", date=date(2025, 1, 1)),
+            Event(title="Shift", date=date(2025, 1, 2), start=time(8), end=time(17, 30)),
+        ],
+        name="test",
+        created=datetime(2025, 1, 1, 9, 30, 15, 123456),
+        last_updated=datetime(2025, 1, 2),
+    )
+
+    content = calendar.to_json()
+
+    assert '"title": "New Year\\u2019s Day"' in content
+    assert content.isascii()
+    assert '  "created": "2025-01-01T09:30:15.123456",\n' in content
+    assert json.loads(content)["events"][1]["start"] == "0800"
@@ -1,15 +1,20 @@
 """Tests for output layer."""
 
 import tempfile
+import threading
 from datetime import date, datetime, time
 from pathlib import Path
 
+import click
 import pytest
 from icalendar import Calendar as ICalendar
+from typer.testing import CliRunner
 
 from app.models.calendar import Calendar
 from app.models.event import Event
 from app.output.ics_writer import ICSWriter
+from app.storage.calendar_repository import CalendarRepository
+from cli.parser import app
 
 
 def make_calendar(events: list[Event], name: str = "test") -> Calendar:
@@ -125,3 +130,108 @@ def test_calendar_save_load():
         assert loaded.events[0].title == "Test Event"
     finally:
         temp_path.unlink()
+
+
+def _ingest_calendar(cli_env: Path, name: str) -> None:
+    """Create a calendar with one event through the ingest command."""
+    source = cli_env / f"{name}.json"
+    source.write_text(
+        '{"events": [{"title": "Clinic", "date": "2025-01-06", '
+        '"start": "0900", "end": "1000"}]}'
+    )
+    result = CliRunner().invoke(app, ["ingest", name, str(source), "--force"])
+    assert result.exit_code == 0, result.output
+
+
+def test_export_all_exports_every_calendar(cli_env):
+    """export-all writes an ICS file for each calendar, listed in name order."""
+    for name in ("zeta", "alpha", "mid"):
+        _ingest_calendar(cli_env, name)
+
+    result = CliRunner().invoke(app, ["export-all", "--jobs", "2"])
+    output = click.unstyle(result.output)
+
+    assert result.exit_code == 0, output
+    assert "Exporting 3 calendars..." in output
+    lines = [line.strip() for line in output.splitlines() if "✓" in line]
+    assert lines == ["✓ alpha", "✓ mid", "✓ zeta"]
+    assert "Exported: 3, Failed: 0" in output
+    for name in ("zeta", "alpha", "mid"):
+        assert (cli_env / "calendars" / name / "calendar.ics").exists()
+
+
+def test_export_all_reports_failed_calendar(cli_env):
+    """A calendar that fails to export is reported without stopping the others."""
+    _ingest_calendar(cli_env, "good")
+    _ingest_calendar(cli_env, "broken")
+    (cli_env / "calendars" / "broken" / "data.json").write_text("not json")
+
+    result = CliRunner().invoke(app, ["export-all"])
+    output = click.unstyle(result.output)
+
+    assert result.exit_code == 0, output
+    assert "✓ good" in output
+    assert "✗ broken:" in output
+    assert "Exported: 1, Failed: 1" in output
+    assert (cli_env / "calendars" / "good" / "calendar.ics").exists()
+    assert not (cli_env / "calendars" / "broken" / "calendar.ics").exists()
+
+
+def test_export_all_without_calendars(cli_env):
+    """export-all with an empty calendar directory exports nothing."""
+    result = CliRunner().invoke(app, ["export-all"])
+
+    assert result.exit_code == 0, result.output
+    assert "No calendars found." in result.output
+
+
+def test_export_all_starts_exporting_during_scan(cli_env, monkeypatch):
+    """Exports start while the calendar directory is still being scanned."""
+    for name in ("alpha", "beta"):
+        _ingest_calendar(cli_env, name)
+
+    export_ics = CalendarRepository.export_ics
+    first_export_started = threading.Event()
+    started_during_scan = []
+
+    def tracking_export_ics(self, *args, **kwargs):
+        first_export_started.set()
+        return export_ics(self, *args, **kwargs)
+
+    def slow_iter_calendars(self):
+        yield "alpha"
+        # The scan has not finished; the first export should already be running
+        started_during_scan.append(first_export_started.wait(timeout=5))
+        yield "beta"
+
+    monkeypatch.setattr(CalendarRepository, "export_ics", tracking_export_ics)
+    monkeypatch.setattr(CalendarRepository, "iter_calendars", slow_iter_calendars)
+
+    result = CliRunner().invoke(app, ["export-all"])
+
+    assert result.exit_code == 0, result.output
+    assert started_during_scan == [True]
+    assert "Exported: 2, Failed: 0" in click.unstyle(result.output)
+
+
+def test_export_all_looks_up_missing_template_once(cli_env, monkeypatch):
+    """A missing template shared by every calendar is looked up only once."""
+    import cli.commands.export as export_module
+
+    for name in ("alpha", "beta", "gamma"):
+        _ingest_calendar(cli_env, name)
+
+    lookups = []
+    get_template = export_module.get_template
+
+    def counting_get_template(name, template_dir):
+        lookups.append(name)
+        return get_template(name, template_dir)
+
+    monkeypatch.setattr(export_module, "get_template", counting_get_template)
+
+    result = CliRunner().invoke(app, ["export-all", "--template", "missing"])
+
+    assert result.exit_code == 0, result.output
+    assert "Exported: 3, Failed: 0" in click.unstyle(result.output)
+    assert lookups == ["missing"]
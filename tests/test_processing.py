@@ -173,6 +173,53 @@ def test_merge_events_upsert_by_id():
     assert uid3_events[0].title == "New Event"
 
 
+def test_update_calendar_uses_existing_calendar_from_caller():
+    """Test that a calendar passed in by the caller is not loaded again."""
+
+    class UnreadableRepository:
+        def load_calendar(self, name):
+            raise AssertionError("calendar should not be reloaded")
+
+    manager = CalendarManager(UnreadableRepository())
+    existing = make_calendar([Event(title="Old", date=date(2024, 5, 1))])
+    raw = RawIngestion(events=[Event(title="New", date=date(2025, 1, 1))])
+
+    result = manager.create_or_update(
+        "test", raw, is_new=False, strategy=Add(), existing=existing
+    )
+    assert sorted(e.title for e in result.calendar.events) == ["New", "Old"]
+    assert result.calendar.created == existing.created
+
+
+def test_combine_ingestions_dedupes_uids_for_upsert():
+    """Test that a bulk batch keeps the last event per UID when upserting."""
+    from cli.commands.ingest import _combine_ingestions
+
+    first = RawIngestion(
+        events=[
+            Event(title="Event 1", date=date(2025, 1, 1), uid="uid-1"),
+            Event(title="No UID", date=date(2025, 1, 2)),
+        ],
+        revised_at=date(2025, 1, 1),
+    )
+    second = RawIngestion(
+        events=[
+            Event(title="Event 1 Updated", date=date(2025, 1, 1), uid="uid-1"),
+            Event(title="No UID", date=date(2025, 1, 2)),
+        ],
+        revised_at=date(2025, 2, 1),
+    )
+
+    combined = _combine_ingestions([first, second], UpsertById())
+    assert [e.title for e in combined.events if e.uid] == ["Event 1 Updated"]
+    assert len([e for e in combined.events if not e.uid]) == 2
+    assert combined.revised_at == date(2025, 2, 1)
+
+    # Other strategies see every event from every file
+    combined = _combine_ingestions([first, second], Add())
+    assert len(combined.events) == 4
+
+
 def test_infer_year_single():
     """Test year inference with single year."""
     events = [
@@ -91,6 +91,19 @@ def test_parse_remote_url_https():
     assert repo == "repo"
 
 
+def test_parse_remote_url_keeps_repo_name_ending_in_git_letters():
+    """Test only a literal .git suffix is removed (not trailing g/i/t/.)."""
+    generator = SubscriptionUrlGenerator(Path("data/calendars"))
+    assert generator._parse_remote_url("https://github.com/owner/dotnet.git") == (
+        "owner",
+        "dotnet",
+    )
+    assert generator._parse_remote_url("git@github.com:owner/digit") == (
+        "owner",
+        "digit",
+    )
+
+
 def test_parse_remote_url_invalid():
     """Test parsing invalid remote URL."""
     generator = SubscriptionUrlGenerator(Path("data/calendars"))
@@ -363,3 +376,20 @@ def test_git_service_stage_calendar_files_relative_to_repo_root(tmp_path):
         check=False,
     )
     assert "test_calendar/calendar.ics" in result.stdout or "A" in result.stdout
+
+
+def test_generate_subscription_urls_looks_up_repo_once():
+    """Test branch and repo root are looked up once per generator."""
+    generator = SubscriptionUrlGenerator(
+        Path("data/calendars"), remote_url="https://github.com/user/repo.git"
+    )
+
+    with patch.object(generator, "_get_branch", return_value="main") as mock_branch, \
+         patch.object(generator, "_get_repo_root", return_value=None) as mock_root:
+        first = generator.generate_subscription_urls("alpha", Path("alpha/calendar.ics"), "ics")
+        second = generator.generate_subscription_urls("beta", Path("beta/calendar.ics"), "ics")
+
+    assert first[0].endswith("/user/repo/main/alpha/calendar.ics")
+    assert second[0].endswith("/user/repo/main/beta/calendar.ics")
+    mock_branch.assert_called_once()
+    mock_root.assert_called_once()
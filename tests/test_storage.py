@@ -394,3 +394,178 @@ def test_calendar_repository_calendar_exists(repository):
 
     # Now should exist
     assert repository.calendar_exists("test_calendar")
+
+
+def test_git_service_file_unchanged_between(repository, temp_calendar_dir):
+    """Test GitService.file_unchanged_between for commits and working directory."""
+    data_file = temp_calendar_dir / "data.json"
+    data_file.write_text("v1")
+    subprocess.run(["git", "add", "data.json"], cwd=temp_calendar_dir, check=True)
+    subprocess.run(["git", "commit", "-m", "v1"], cwd=temp_calendar_dir, check=True)
+
+    git_service = repository.git_service
+    head = git_service.get_file_versions(data_file)[0][0]
+
+    assert git_service.file_unchanged_between(data_file, head, None)
+    assert git_service.file_unchanged_between(data_file, None, head)
+    assert not git_service.file_unchanged_between(data_file, None, None)
+
+    data_file.write_text("v2")
+    assert not git_service.file_unchanged_between(data_file, head, None)
+
+
+def test_calendar_repository_export_ics_with_loaded_calendar(repository):
+    """Test export_ics writes a passed-in calendar without reloading it."""
+    events = [Event(title="Test", date=datetime(2025, 1, 1).date())]
+    calendar = make_calendar(events, name="test_calendar")
+    repository.save(calendar)
+
+    calendar.events.append(Event(title="Unsaved", date=datetime(2025, 1, 2).date()))
+    ics_path = repository.export_ics("test_calendar", calendar=calendar)
+
+    assert "Unsaved" in ics_path.read_text()
+
+
+def test_calendar_repository_iter_calendars(repository):
+    """Test iter_calendars yields only directories with config.json."""
+    repository.create_calendar("alpha")
+    repository.create_calendar("beta")
+    (repository.calendar_dir / "no_config").mkdir()
+
+    assert sorted(repository.iter_calendars()) == ["alpha", "beta"]
+
+
+def test_git_service_set_remote_url(repository):
+    """Test set_remote_url adds a missing remote and updates an existing one."""
+    git_service = repository.git_service
+
+    git_service.set_remote_url("https://github.com/user/first.git")
+    assert git_service.get_remote_url() == "https://github.com/user/first.git"
+
+    git_service.set_remote_url("https://github.com/user/second.git")
+    assert git_service.get_remote_url() == "https://github.com/user/second.git"
+
+
+def test_calendar_repository_count_and_latest_version(repository, temp_calendar_dir):
+    """Test bounded version queries agree with the full version list."""
+    assert repository.count_calendar_versions("test_calendar") == 0
+    assert repository.get_latest_calendar_version("test_calendar") is None
+
+    data_file = repository.paths("test_calendar").data
+    data_file.parent.mkdir(parents=True, exist_ok=True)
+    for content in ("v1", "v2"):
+        data_file.write_text(content)
+        subprocess.run(["git", "add", "."], cwd=temp_calendar_dir, check=True)
+        subprocess.run(["git", "commit", "-m", content], cwd=temp_calendar_dir, check=True)
+
+    versions = repository.list_calendar_versions("test_calendar")
+    assert repository.count_calendar_versions("test_calendar") == len(versions) == 2
+    assert repository.get_latest_calendar_version("test_calendar") == versions[0]
+    assert repository.git_service.get_commit_date(versions[1][0]) == versions[1][1]
+
+
+def test_git_service_file_history_summary(repository, temp_calendar_dir):
+    """Test get_file_history_summary matches the individual lookups."""
+    git_service = repository.git_service
+    data_file = repository.paths("test_calendar").data
+    data_file.parent.mkdir(parents=True, exist_ok=True)
+    data_file.write_text("v1")
+    subprocess.run(["git", "add", "."], cwd=temp_calendar_dir, check=True)
+    subprocess.run(["git", "commit", "-m", "v1"], cwd=temp_calendar_dir, check=True)
+    git_service.set_remote_url("https://github.com/user/repo.git")
+
+    summary = git_service.get_file_history_summary(data_file)
+
+    assert summary.commit_count == 1
+    assert summary.latest == git_service.get_file_versions(data_file)[0]
+    assert summary.remote_url == "https://github.com/user/repo.git"
+
+
+def test_git_service_get_files_at_commits(repository, temp_calendar_dir):
+    """Test batched file reads match per-commit reads and skip missing files."""
+    from app.storage.git_service import _git_blob_id
+
+    git_service = repository.git_service
+    other_file = temp_calendar_dir / "other.txt"
+    other_file.write_text("unrelated")
+    subprocess.run(["git", "add", "."], cwd=temp_calendar_dir, check=True)
+    subprocess.run(["git", "commit", "-m", "init"], cwd=temp_calendar_dir, check=True)
+    before = git_service.get_file_versions(other_file)[0][0]
+
+    data_file = temp_calendar_dir / "data.json"
+    for content in ("v1\n", "v2\nwith\nlines"):
+        data_file.write_text(content)
+        subprocess.run(["git", "add", "."], cwd=temp_calendar_dir, check=True)
+        subprocess.run(["git", "commit", "-m", "update"], cwd=temp_calendar_dir, check=True)
+    commits = [commit for commit, _, _ in git_service.get_file_versions(data_file)]
+
+    contents = git_service.get_files_at_commits(data_file, [*commits, before])
+
+    assert {commit: content for commit, (_, content) in contents.items()} == {
+        commit: git_service.get_file_at_commit(data_file, commit) for commit in commits
+    }
+    assert contents[commits[0]] == (
+        _git_blob_id(b"v2\nwith\nlines"),
+        b"v2\nwith\nlines",
+    )
+    assert git_service.get_current_commit_hash(data_file) == commits[0]
+    data_file.write_text("v1\n")
+    assert git_service.get_current_commit_hash(data_file) == commits[1]
+
+
+def test_git_service_blob_ids_match_git(repository, temp_calendar_dir):
+    """Test blob ids from batch-check match git's hash of the content."""
+    from app.storage.git_service import _git_blob_id
+
+    git_service = repository.git_service
+    data_file = temp_calendar_dir / "data.json"
+    data_file.write_bytes(b"content\x00with bytes")
+    subprocess.run(["git", "add", "."], cwd=temp_calendar_dir, check=True)
+    subprocess.run(["git", "commit", "-m", "v1"], cwd=temp_calendar_dir, check=True)
+    commit = git_service.get_file_versions(data_file)[0][0]
+
+    blob_ids = git_service.get_blob_ids_at_commits(data_file, [commit, "HEAD~5"])
+
+    expected = subprocess.run(
+        ["git", "hash-object", "data.json"],
+        cwd=temp_calendar_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    assert blob_ids == {commit: expected}
+    assert _git_blob_id(data_file.read_bytes()) == expected
+
+
+def test_calendar_repository_serialize_then_write_json(repository):
+    """Test serialize_json + write_json produce the same file as save_json."""
+    events = [Event(title="Test", date=datetime(2025, 1, 1).date())]
+    calendar = make_calendar(events, name="test_calendar")
+
+    content = repository.serialize_json(calendar)
+    path = repository.write_json(calendar.name, content)
+
+    assert path == repository.paths("test_calendar").data
+    assert path.read_text() == content == calendar.to_json()
+    assert repository.load_calendar("test_calendar").events == events
+
+
+
+def test_confirm_and_save_json_stamps_before_prompt(repository, monkeypatch):
+    """Test the save prompt leaves last_updated as stamped when it opened."""
+    import cli.commands.ingest as ingest_module
+
+    calendar = make_calendar(
+        [Event(title="Test", date=datetime(2025, 1, 1).date())], name="test_calendar"
+    )
+    stamped = []
+    monkeypatch.setattr(
+        ingest_module,
+        "confirm_or_exit",
+        lambda prompt: stamped.append(calendar.last_updated),
+    )
+
+    path = ingest_module._confirm_and_save_json(repository, calendar, force=False)
+
+    assert stamped == [calendar.last_updated]
+    assert path.read_text() == calendar.to_json()
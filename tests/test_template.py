@@ -1,6 +1,7 @@
 """Tests for template models and loading."""
 
 import json
+import os
 import tempfile
 from pathlib import Path
 
@@ -128,6 +129,25 @@ def test_template_loader():
         assert template is template2  # Should be same object from cache
 
 
+def test_template_loader_reloads_modified_base(tmp_path):
+    """Test cached templates are reloaded when an extended template changes."""
+    clear_cache()
+
+    base_path = tmp_path / "base.json"
+    base_path.write_text(json.dumps({"name": "base", "version": "1.0", "types": {}}))
+    (tmp_path / "child.json").write_text(json.dumps({"name": "child", "extends": "base"}))
+
+    template = load_template("child", tmp_path)
+    assert template.version == "1.0"
+    assert load_template("child", tmp_path) is template
+
+    base_path.write_text(json.dumps({"name": "base", "version": "2.0", "types": {}}))
+    stat = base_path.stat()
+    os.utime(base_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_template("child", tmp_path).version == "2.0"
+
+
 def test_template_loader_not_found():
     """Test template loader with missing file."""
     clear_cache()